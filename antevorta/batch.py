@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+from antevorta.config import CONFIG
+from antevorta.estimators import EstimatorConfig
+from antevorta.export import export_assessment
+from antevorta.events import load_events_geodataframe
+from antevorta.factors import load_factors, reserve_factor_caches
+from antevorta.grid import build_grid, load_project_aoi
+from antevorta.io import write_dataframe_csv
+from antevorta.loader import load_assessment_inputs
+from antevorta.model import build_training_data, factor_weights, predict_likelihood, train_logistic_regression
+from antevorta.project import ProjectState, initialize_project, load_manifest, save_manifest
+
+
+@dataclass(frozen=True)
+class BatchTarget:
+    """One project to assess; ``aoi`` is set when the project is created from a template."""
+
+    name: str
+    state: ProjectState
+    output_dir: Path
+    aoi: Path | None = None
+
+
+@dataclass(frozen=True)
+class BatchTemplate:
+    events_path: str
+    factors: list[dict[str, object]]
+    resolution_m: float
+
+
+def _is_project_dir(path: Path) -> bool:
+    return (path / CONFIG.project_dir_name / "project.json").is_file()
+
+
+def load_template(directory: Path, resolution_m: float | None = None) -> BatchTemplate:
+    state = ProjectState.from_dir(directory)
+    manifest = load_manifest(state)
+    events_path = manifest.get("events_path")
+    if not isinstance(events_path, str):
+        raise ValueError(f"Template project has no events: {directory}")
+    resolution = resolution_m if resolution_m is not None else manifest.get("grid_resolution_m")
+    if not isinstance(resolution, (int, float)) or resolution <= 0:
+        raise ValueError("Template project has no grid resolution; pass --resolution")
+    return BatchTemplate(events_path=events_path, factors=load_factors(state), resolution_m=float(resolution))
+
+
+def plan_batch(targets: list[Path], output_dir: Path, template: BatchTemplate | None = None) -> list[BatchTarget]:
+    """Resolve project directories and AOI files into batch targets.
+
+    Project directories are assessed in place. Each AOI file becomes a new project
+    under ``output_dir/<aoi stem>`` with the template's events inside that AOI; it
+    reuses the template's stored factor files rather than copying them.
+    """
+    planned: list[BatchTarget] = []
+    for target in targets:
+        if target.is_dir():
+            if not _is_project_dir(target):
+                raise ValueError(f"Not an antevorta project directory: {target}")
+            planned.append(BatchTarget(name=target.name, state=ProjectState.from_dir(target), output_dir=target))
+        elif target.is_file() and target.suffix.lower() == ".geojson":
+            if template is None:
+                raise ValueError(f"AOI target requires --template: {target}")
+            project_dir = output_dir / target.stem
+            planned.append(
+                BatchTarget(
+                    name=target.stem,
+                    state=ProjectState.from_dir(project_dir),
+                    output_dir=project_dir,
+                    aoi=target.resolve(),
+                )
+            )
+        else:
+            raise ValueError(f"Batch target must be a project directory or AOI GeoJSON: {target}")
+
+    names = [target.output_dir.resolve() for target in planned]
+    if len(set(names)) != len(names):
+        raise ValueError("Batch targets must have distinct output directories")
+    return planned
+
+
+def _store_aoi_events(target: BatchTarget, template: BatchTemplate) -> Path:
+    """Store the template events inside the target AOI as the target's own events.
+
+    Background points are sampled inside the AOI only, so events elsewhere would be
+    presences the model cannot contrast with any background.
+    """
+    polygon = load_project_aoi(target.state).gdf_wgs84.geometry.iloc[0]
+    events = load_events_geodataframe(Path(template.events_path))
+    inside = events[events.within(polygon)]
+    if inside.empty:
+        raise ValueError(f"No template events fall inside AOI: {target.aoi}")
+    events_path = target.state.data_dir / "events.csv"
+    write_dataframe_csv(pd.DataFrame(inside.drop(columns="geometry")), events_path)
+    return events_path
+
+
+def _create_from_template(target: BatchTarget, template: BatchTemplate) -> None:
+    initialize_project(target.aoi, target.state)
+    events_path = str(_store_aoi_events(target, template).resolve())
+    manifest = load_manifest(target.state)
+    manifest["events_path"] = events_path
+    # Event-density factors count the target's events, not the template's.
+    manifest["factors"] = [
+        {**factor, "path": events_path} if factor["source"] == "events" else factor for factor in template.factors
+    ]
+    save_manifest(target.state, manifest)
+    build_grid(target.state, template.resolution_m)
+
+
+def assess_project(
+    state: ProjectState,
+    output_dir: Path,
+    config: EstimatorConfig | None = None,
+    output_format: str = "geojson",
+) -> dict[str, Path]:
+    events, grid, factors = load_assessment_inputs(state)
+    data = build_training_data(events, grid, factors)
+    fitted = train_logistic_regression(data, config=config)
+    ranked = predict_likelihood(fitted, grid, factors, events=events)
+    return export_assessment(ranked, factor_weights(fitted), output_dir, fmt=output_format)
+
+
+def _run_target(
+    target: BatchTarget,
+    template: BatchTemplate | None,
+    config: EstimatorConfig | None,
+    output_format: str,
+) -> dict[str, Path]:
+    if target.aoi is not None:
+        if template is None:
+            raise ValueError(f"AOI target requires --template: {target.aoi}")
+        _create_from_template(target, template)
+    outputs = assess_project(target.state, target.output_dir, config, output_format)
+    logging.info("Assessed %s: %s", target.name, outputs["likelihood_grid"])
+    return outputs
+
+
+def run_batch(
+    targets: list[BatchTarget],
+    template: BatchTemplate | None = None,
+    jobs: int = 1,
+    config: EstimatorConfig | None = None,
+    output_format: str = "geojson",
+) -> list[dict[str, Path]]:
+    """Assess every target in worker threads sharing the process-wide factor caches.
+
+    Every target runs even if another fails; failures are reported together, in
+    target order, once all workers finish.
+    """
+    if jobs <= 0:
+        raise ValueError("jobs must be > 0")
+    if template is not None:
+        # Concurrent AOI projects each read their own window of every template factor.
+        reserve_factor_caches(jobs * len(template.factors))
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_run_target, target, template, config, output_format) for target in targets]
+
+    results: list[dict[str, Path]] = []
+    failures: list[str] = []
+    for target, future in zip(targets, futures):
+        exc = future.exception()
+        if exc is not None:
+            failures.append(f"{target.name}: {exc}")
+            continue
+        results.append(future.result())
+    if failures:
+        details = "\n".join(failures)
+        raise ValueError(f"Batch failed for {len(failures)} project(s):\n{details}")
+    return results
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import tempfile
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from antevorta.config import CONFIG
+from antevorta.estimators import EstimatorConfig
+from antevorta.model import TrainingData, train_logistic_regression
+
+
+GRID_QUANTILES = (0.05, 0.5, 0.95)
+WEIGHT_CI = (0.025, 0.975)
+# Upper bound on floats held in memory at once when summarizing replicate predictions.
+SUMMARY_BLOCK_VALUES = 8_000_000
+PREDICT_BLOCK_ROWS = 250_000
+
+
+@dataclass
+class BootstrapResult:
+    grid: pd.DataFrame
+    weights: pd.DataFrame
+
+
+def _resample_rows(y: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    # Resample within each class so every replicate keeps both labels.
+    rows = [rng.choice(np.flatnonzero(y == label), size=int((y == label).sum()), replace=True) for label in (1, 0)]
+    return np.concatenate(rows)
+
+
+def _fit_replicate(
+    replicate: int,
+    seed: int,
+    x: np.ndarray,
+    y: np.ndarray,
+    feature_names: list[str],
+    features_path: Path,
+    proba_path: Path,
+    config: EstimatorConfig,
+) -> np.ndarray:
+    rows = _resample_rows(y, np.random.default_rng(seed))
+    data = TrainingData(
+        x=pd.DataFrame(x[rows], columns=feature_names),
+        y=pd.Series(y[rows], name="label"),
+    )
+    fitted = train_logistic_regression(data, config=replace(config, seed=seed))
+
+    # Both files are memory-mapped: workers share the read-only feature matrix and
+    # write their own row of the prediction matrix without copying either.
+    features = np.load(features_path, mmap_mode="r")
+    proba = np.load(proba_path, mmap_mode="r+")
+    for start in range(0, len(features), PREDICT_BLOCK_ROWS):
+        stop = start + PREDICT_BLOCK_ROWS
+        proba[replicate, start:stop] = fitted.predict_proba(features[start:stop])
+    proba.flush()
+    return np.asarray(fitted.estimator.coef_[0], dtype=float)
+
+
+def _summarize_grid(proba: np.ndarray, cell_ids: np.ndarray) -> pd.DataFrame:
+    n_replicates, n_cells = proba.shape
+    block = max(1, SUMMARY_BLOCK_VALUES // n_replicates)
+    mean = np.empty(n_cells)
+    std = np.empty(n_cells)
+    quantiles = np.empty((len(GRID_QUANTILES), n_cells))
+    for start in range(0, n_cells, block):
+        values = np.asarray(proba[:, start : start + block], dtype=float)
+        mean[start : start + block] = values.mean(axis=0)
+        std[start : start + block] = values.std(axis=0, ddof=1) if n_replicates > 1 else 0.0
+        quantiles[:, start : start + block] = np.quantile(values, GRID_QUANTILES, axis=0)
+
+    out = pd.DataFrame({"cell_id": cell_ids, "probability_mean": mean, "probability_std": std})
+    for q, values in zip(GRID_QUANTILES, quantiles):
+        out[f"probability_q{round(q * 100):02d}"] = values
+    return out
+
+
+def _summarize_weights(coefs: np.ndarray, feature_names: list[str]) -> pd.DataFrame:
+    low, high = np.quantile(coefs, WEIGHT_CI, axis=0)
+    return pd.DataFrame(
+        {
+            "factor": feature_names,
+            "weight_mean": coefs.mean(axis=0),
+            "weight_std": coefs.std(axis=0, ddof=1) if len(coefs) > 1 else np.zeros(coefs.shape[1]),
+            "weight_ci_low": low,
+            "weight_ci_high": high,
+        }
+    ).sort_values("weight_mean", ascending=False)
+
+
+def bootstrap_assessment(
+    data: TrainingData,
+    grid_features: pd.DataFrame,
+    cell_ids: np.ndarray,
+    replicates: int,
+    jobs: int = 1,
+    seed: int = CONFIG.seed,
+    config: EstimatorConfig | None = None,
+) -> BootstrapResult:
+    """Refit on ``replicates`` class-stratified resamples and score the grid with each fit.
+
+    Replicate predictions go to a disk-backed ``(replicates, cells)`` float32 matrix that
+    is summarized in column blocks, so memory stays flat as ``replicates`` grows.
+    """
+    if replicates < 2:
+        raise ValueError("Bootstrap requires at least 2 replicates")
+    if jobs == 0:
+        raise ValueError("jobs must be non-zero")
+    if data.y.nunique() < 2:
+        raise ValueError("Training labels must include both event and background classes")
+    if len(grid_features) != len(cell_ids):
+        raise ValueError("Grid features and cell ids must have the same length")
+
+    config = config or EstimatorConfig(seed=seed)
+    feature_names = list(data.x.columns)
+    x = data.x.to_numpy(dtype=float)
+    y = data.y.to_numpy(dtype=int)
+    seeds = np.random.default_rng(seed).integers(0, 2**31 - 1, size=replicates)
+
+    with tempfile.TemporaryDirectory(prefix="antevorta-bootstrap-") as tmp:
+        features_path = Path(tmp) / "grid_features.npy"
+        proba_path = Path(tmp) / "probability.npy"
+        np.save(features_path, grid_features[feature_names].to_numpy(dtype=float))
+        np.lib.format.open_memmap(proba_path, mode="w+", dtype=np.float32, shape=(replicates, len(cell_ids))).flush()
+
+        coefs = Parallel(n_jobs=jobs)(
+            delayed(_fit_replicate)(i, int(seeds[i]), x, y, feature_names, features_path, proba_path, config)
+            for i in range(replicates)
+        )
+        proba = np.load(proba_path, mmap_mode="r")
+        grid = _summarize_grid(proba, np.asarray(cell_ids))
+        del proba
+
+    return BootstrapResult(grid=grid, weights=_summarize_weights(np.vstack(coefs), feature_names))
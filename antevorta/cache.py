@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+
+V = TypeVar("V")
+
+
+class SharedCache(Generic[V]):
+    """Thread-safe memo that computes each key once.
+
+    Concurrent callers asking for a key that is still being computed wait for the
+    first caller's result instead of loading it again. The oldest entries are
+    evicted beyond ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Future[V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], V]) -> V:
+        with self._lock:
+            future = self._entries.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._entries[key] = future
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+
+        if owner:
+            try:
+                future.set_result(compute())
+            except BaseException as exc:
+                with self._lock:
+                    if self._entries.get(key) is future:
+                        del self._entries[key]
+                future.set_exception(exc)
+        return future.result()
+
+    def reserve(self, size: int) -> None:
+        """Grow ``maxsize`` to hold at least ``size`` entries; never shrinks it."""
+        with self._lock:
+            self.maxsize = max(self.maxsize, size)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -4,13 +4,35 @@ import argparse
 import logging
 from pathlib import Path
 
-from antevorta.events import add_events, load_events_geodataframe
-from antevorta.export import export_assessment
-from antevorta.factors import add_factor, load_factors
-from antevorta.grid import build_grid, load_grid
-from antevorta.model import build_training_data, factor_weights, predict_likelihood, train_logistic_regression
-from antevorta.project import ProjectState, initialize_project, load_manifest
-from antevorta.validation import validate_model
+from antevorta.batch import load_template, plan_batch, run_batch
+from antevorta.bootstrap import bootstrap_assessment
+from antevorta.config import CONFIG
+from antevorta.estimators import SOLVERS, EstimatorConfig
+from antevorta.events import add_events
+from antevorta.export import LIKELIHOOD_FORMATS, export_assessment, export_bootstrap
+from antevorta.factors import (
+    EVENT_DENSITY_KERNELS,
+    ZONAL_STATS,
+    add_event_density_factors,
+    add_factor,
+    add_zonal_factor,
+)
+from antevorta.grid import build_grid
+from antevorta.loader import load_assessment_inputs
+from antevorta.model import (
+    EventHistoryFeatures,
+    background_points,
+    build_feature_matrix,
+    build_training_data,
+    factor_weights,
+    is_event_history_factor,
+    predict_likelihood,
+    train_logistic_regression,
+)
+from antevorta.pipeline import Pipeline
+from antevorta.project import ProjectState, initialize_project
+from antevorta.temporal import parse_time_bound
+from antevorta.validation import validate_model, validate_temporal
 
 
 def configure_logging() -> None:
@@ -44,8 +66,28 @@ def cmd_add_events(args: argparse.Namespace) -> None:
 
 def cmd_add_factor(args: argparse.Namespace) -> None:
     state = ProjectState.from_cwd()
-    factor = add_factor(state, _require_file(args.factor).resolve(), args.type)
-    logging.info("Registered factor: %s (%s)", factor["name"], factor["source"])
+    if args.type == "event-density":
+        if args.factor is not None:
+            raise ValueError("Event-density factors are derived from project events; omit the factor file")
+        factors = add_event_density_factors(state, args.radius or [], args.kernel)
+    elif args.type == "zonal":
+        if args.factor is None:
+            raise ValueError("A raster file is required for --type zonal")
+        factors = [add_zonal_factor(state, _require_file(args.factor).resolve(), args.stat, args.threshold)]
+    else:
+        if args.factor is None:
+            raise ValueError(f"A factor file is required for --type {args.type}")
+        factors = [
+            add_factor(
+                state,
+                _require_file(args.factor).resolve(),
+                args.type,
+                max_distance_m=args.max_distance,
+                simplify_m=float(args.simplify),
+            )
+        ]
+    for factor in factors:
+        logging.info("Registered factor: %s (%s)", factor["name"], factor["source"])
 
 
 def cmd_build_grid(args: argparse.Namespace) -> None:
@@ -54,38 +96,67 @@ def cmd_build_grid(args: argparse.Namespace) -> None:
     logging.info("Built grid: %s", path)
 
 
-def _prepare_assessment_inputs(state: ProjectState):
-    manifest = load_manifest(state)
-    events_path = manifest.get("events_path")
-    if not isinstance(events_path, str):
-        raise ValueError("Events missing. Run: antevorta add-events <events-file>")
+def _prepare_assessment_inputs(state: ProjectState, args: argparse.Namespace):
+    return load_assessment_inputs(state, since=parse_time_bound(args.since), until=parse_time_bound(args.until))
 
-    events = load_events_geodataframe(Path(events_path))
-    grid = load_grid(state)
-    factors = load_factors(state)
-    return events, grid, factors
 
-
-def cmd_assess(_: argparse.Namespace) -> None:
+def cmd_assess(args: argparse.Namespace) -> None:
     state = ProjectState.from_cwd()
-    events, grid, factors = _prepare_assessment_inputs(state)
+    events, grid, factors = _prepare_assessment_inputs(state, args)
 
+    config = EstimatorConfig(solver=args.solver)
     data = build_training_data(events, grid, factors)
-    fitted = train_logistic_regression(data)
-    ranked = predict_likelihood(fitted, grid, factors)
+    fitted = train_logistic_regression(data, config=config)
+    grid_x = build_feature_matrix(grid, factors, events=events)
+    ranked = predict_likelihood(fitted, grid, factors, features=grid_x)
     weights = factor_weights(fitted)
 
-    outputs = export_assessment(grid, ranked, weights, Path.cwd())
+    outputs = export_assessment(ranked, weights, Path.cwd(), fmt=args.format)
     logging.info("Wrote likelihood surface: %s", outputs["likelihood_grid"])
     logging.info("Wrote ranked grid: %s", outputs["ranked_grid"])
     logging.info("Wrote factor weights: %s", outputs["factor_weights"])
 
+    if args.bootstrap is not None:
+        result = bootstrap_assessment(
+            data,
+            grid_x,
+            grid.cell_ids,
+            int(args.bootstrap),
+            jobs=int(args.jobs),
+            config=config,
+        )
+        outputs = export_bootstrap(result, Path.cwd())
+        logging.info("Wrote likelihood uncertainty: %s", outputs["likelihood_uncertainty"])
+        logging.info("Wrote factor weight intervals: %s", outputs["factor_weights_ci"])
+
 
 def cmd_validate(args: argparse.Namespace) -> None:
     state = ProjectState.from_cwd()
-    events, grid, factors = _prepare_assessment_inputs(state)
+    events, grid, factors = _prepare_assessment_inputs(state, args)
+    config = EstimatorConfig(solver=args.solver, warm_start=bool(args.warm_start))
+    if args.temporal is not None:
+        static = [factor for factor in factors if not is_event_history_factor(factor)]
+        history = [factor for factor in factors if is_event_history_factor(factor)]
+        background = background_points(grid, max(1, len(events) * CONFIG.background_multiplier))
+        metrics = validate_temporal(
+            build_feature_matrix(events, static),
+            events["timestamp"],
+            build_feature_matrix(background, static),
+            int(args.temporal),
+            config=config,
+            history=EventHistoryFeatures(events, background, history) if history else None,
+        )
+        logging.info(
+            "Temporal validation complete: windows=%d folds=%d auc_mean=%.6f auc_std=%.6f",
+            int(metrics["windows"]),
+            int(metrics["folds"]),
+            metrics["auc_mean"],
+            metrics["auc_std"],
+        )
+        return
+
     data = build_training_data(events, grid, factors)
-    metrics = validate_model(data, int(args.kfold))
+    metrics = validate_model(data, int(args.kfold), config=config)
     logging.info(
         "Cross-validation complete: k=%d auc_mean=%.6f auc_std=%.6f",
         int(metrics["kfold"]),
@@ -94,6 +165,40 @@ def cmd_validate(args: argparse.Namespace) -> None:
     )
 
 
+def cmd_run(args: argparse.Namespace) -> None:
+    state = ProjectState.from_cwd()
+    pipeline = Pipeline(state, Path.cwd(), config=EstimatorConfig(solver=args.solver), output_format=args.format)
+    status = pipeline.run(force=bool(args.force))
+    ran = [stage for stage, result in status.items() if result == "ran"]
+    logging.info("Pipeline complete: %d of %d stage(s) re-executed", len(ran), len(status))
+
+
+def cmd_batch(args: argparse.Namespace) -> None:
+    template = load_template(Path(args.template), args.resolution) if args.template else None
+    targets = plan_batch([Path(t) for t in args.targets], Path(args.output_dir), template)
+    outputs = run_batch(
+        targets,
+        template,
+        jobs=int(args.jobs),
+        config=EstimatorConfig(solver=args.solver),
+        output_format=args.format,
+    )
+    logging.info("Batch complete: %d project(s) assessed", len(outputs))
+
+
+def _add_time_window_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--since", help="only use events at or after this UTC time")
+    parser.add_argument("--until", help="only use events before this UTC time")
+
+
+def _add_solver_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--solver", default="lbfgs", choices=SOLVERS)
+
+
+def _add_format_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--format", default="geojson", choices=list(LIKELIHOOD_FORMATS), help="likelihood grid format")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="antevorta")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -108,8 +213,14 @@ def build_parser() -> argparse.ArgumentParser:
     p_events.set_defaults(func=cmd_add_events)
 
     p_factor = sub.add_parser("add-factor")
-    p_factor.add_argument("factor")
-    p_factor.add_argument("--type", required=True, choices=["distance"])
+    p_factor.add_argument("factor", nargs="?")
+    p_factor.add_argument("--type", required=True, choices=["distance", "event-density", "zonal"])
+    p_factor.add_argument("--radius", action="append", type=float, help="event-density radius in meters (repeatable)")
+    p_factor.add_argument("--kernel", default="count", choices=EVENT_DENSITY_KERNELS)
+    p_factor.add_argument("--stat", default="mean", choices=ZONAL_STATS, help="zonal statistic per grid cell")
+    p_factor.add_argument("--threshold", type=float, help="pixel threshold for --stat fraction")
+    p_factor.add_argument("--max-distance", type=float, help="cap vector distances at this many meters and read only features that close")
+    p_factor.add_argument("--simplify", type=float, default=0.0, help="vector simplification tolerance in meters")
     p_factor.set_defaults(func=cmd_add_factor)
 
     p_grid = sub.add_parser("build-grid")
@@ -117,12 +228,38 @@ def build_parser() -> argparse.ArgumentParser:
     p_grid.set_defaults(func=cmd_build_grid)
 
     p_assess = sub.add_parser("assess")
+    _add_time_window_arguments(p_assess)
+    _add_solver_argument(p_assess)
+    _add_format_argument(p_assess)
+    p_assess.add_argument("--bootstrap", type=int, metavar="N", help="refit on N resamples for uncertainty")
+    p_assess.add_argument("--jobs", type=int, default=1, help="parallel bootstrap workers (-1 for all cores)")
     p_assess.set_defaults(func=cmd_assess)
 
     p_validate = sub.add_parser("validate")
-    p_validate.add_argument("--kfold", required=True, type=int)
+    mode = p_validate.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--kfold", type=int)
+    mode.add_argument("--temporal", type=int, metavar="WINDOWS", help="rolling-origin validation over N time windows")
+    _add_time_window_arguments(p_validate)
+    _add_solver_argument(p_validate)
+    p_validate.add_argument("--warm-start", action="store_true", help="start each temporal window from the previous fit")
     p_validate.set_defaults(func=cmd_validate)
 
+    p_run = sub.add_parser("run")
+    p_run.add_argument("--force", action="store_true", help="re-execute every stage")
+    _add_solver_argument(p_run)
+    _add_format_argument(p_run)
+    p_run.set_defaults(func=cmd_run)
+
+    p_batch = sub.add_parser("batch")
+    p_batch.add_argument("targets", nargs="+", help="project directories or AOI GeoJSON files")
+    p_batch.add_argument("--template", help="project whose events and factors are reused for AOI targets")
+    p_batch.add_argument("--resolution", type=float, help="grid resolution for AOI targets (default: template's)")
+    p_batch.add_argument("--output-dir", default=".", help="where projects for AOI targets are created")
+    p_batch.add_argument("--jobs", type=int, default=1)
+    _add_solver_argument(p_batch)
+    _add_format_argument(p_batch)
+    p_batch.set_defaults(func=cmd_batch)
+
     return parser
 
 
@@ -9,6 +9,8 @@ class AppConfig:
     project_dir_name: str = ".antevorta"
     seed: int = 42
     background_multiplier: int = 3
+    io_workers: int = 4
+    event_batch_size: int = 100_000
 
     @property
     def project_dir(self) -> Path:
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.metrics import log_loss
+from sklearn.preprocessing import StandardScaler
+
+from antevorta.config import CONFIG
+
+
+SOLVERS = ("lbfgs", "sgd")
+CLASSES = np.array([0, 1])
+
+Batch = tuple[np.ndarray, np.ndarray]
+BatchFactory = Callable[[], Iterable[Batch]]
+
+
+@dataclass(frozen=True)
+class EstimatorConfig:
+    """Logistic regression settings shared by assessment and validation.
+
+    ``lbfgs`` fits in memory on raw features. ``sgd`` expects standardized features
+    and runs epochs until the log loss stops improving by ``tol`` for
+    ``n_iter_no_change`` epochs, dividing the learning rate by 5 each time, as
+    scikit-learn's ``adaptive`` schedule does. Its L2 penalty is scaled to the
+    number of rows so it matches ``lbfgs``'s default ``C=1``.
+    """
+
+    solver: str = "lbfgs"
+    warm_start: bool = False
+    max_epochs: int = 1000
+    tol: float = 1e-4
+    n_iter_no_change: int = 5
+    eta0: float = 0.1
+    seed: int = CONFIG.seed
+
+    @property
+    def standardize(self) -> bool:
+        return self.solver == "sgd"
+
+
+def fit_scaler(x: np.ndarray) -> StandardScaler:
+    return StandardScaler().fit(x)
+
+
+class LogisticTrainer:
+    """Builds and fits logistic regression estimators for one configuration.
+
+    With ``warm_start`` each fit starts from the previous fit's coefficients in a
+    fresh estimator. That is only sound when earlier training rows cannot be in the
+    current test set, as with expanding temporal windows.
+    """
+
+    def __init__(self, config: EstimatorConfig | None = None) -> None:
+        self.config = config or EstimatorConfig()
+        if self.config.solver not in SOLVERS:
+            allowed = ", ".join(SOLVERS)
+            raise ValueError(f"Unsupported solver {self.config.solver}. Allowed: {allowed}")
+        if self.config.max_epochs <= 0 or self.config.n_iter_no_change <= 0:
+            raise ValueError("max_epochs and n_iter_no_change must be > 0")
+        self._coef: tuple[np.ndarray, np.ndarray] | None = None
+
+    def _initial_coef(self) -> tuple[np.ndarray, np.ndarray] | None:
+        if self.config.warm_start and self._coef is not None:
+            return self._coef
+        return None
+
+    def _remember(self, estimator: LogisticRegression | SGDClassifier) -> None:
+        self._coef = (estimator.coef_.copy(), estimator.intercept_.copy())
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> LogisticRegression | SGDClassifier:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=int)
+        if self.config.solver == "sgd":
+            rng = np.random.default_rng(self.config.seed)
+
+            def batches() -> Iterable[Batch]:
+                order = rng.permutation(len(x))
+                yield x[order], y[order]
+
+            return self.fit_batches(batches)
+
+        estimator = LogisticRegression(
+            solver="lbfgs",
+            random_state=self.config.seed,
+            max_iter=1000,
+            warm_start=self.config.warm_start,
+        )
+        initial = self._initial_coef()
+        if initial is not None:
+            estimator.coef_, estimator.intercept_ = (value.copy() for value in initial)
+        estimator.fit(x, y)
+        self._remember(estimator)
+        return estimator
+
+    def fit_batches(self, batches: BatchFactory) -> SGDClassifier:
+        """Fit SGD logistic regression out of core until the epoch loss converges.
+
+        ``batches`` is called once per epoch and must yield ``(x, y)`` arrays of
+        already standardized features, shuffled as the caller sees fit. Each epoch's
+        loss is measured on every batch just before the model updates on it.
+        """
+        if self.config.solver != "sgd":
+            raise ValueError("Mini-batch training requires solver 'sgd'")
+
+        n_rows = sum(len(y) for _, y in batches())
+        if n_rows == 0:
+            raise ValueError("Mini-batch training received no batches")
+
+        config = self.config
+        estimator = SGDClassifier(
+            loss="log_loss",
+            alpha=1.0 / n_rows,
+            learning_rate="constant",
+            eta0=config.eta0,
+            random_state=config.seed,
+        )
+        initial = self._initial_coef()
+        if initial is not None:
+            # partial_fit keeps coefficients that are already set on its first call.
+            estimator.coef_, estimator.intercept_ = (value.copy() for value in initial)
+
+        best_loss = np.inf
+        stalled = 0
+        for _ in range(config.max_epochs):
+            # Progressive loss: each batch is scored before the model learns from it.
+            measured = hasattr(estimator, "classes_")
+            loss = 0.0
+            for x, y in batches():
+                if measured:
+                    loss += log_loss(y, estimator.predict_proba(x), labels=CLASSES, normalize=False)
+                estimator.partial_fit(x, y, classes=CLASSES)
+            if not measured:
+                continue
+
+            if loss > best_loss - config.tol * n_rows:
+                stalled += 1
+            else:
+                stalled = 0
+            best_loss = min(best_loss, loss)
+            if stalled >= config.n_iter_no_change:
+                if estimator.eta0 <= 1e-6:
+                    break
+                estimator.set_params(eta0=estimator.eta0 / 5.0)
+                stalled = 0
+
+        self._remember(estimator)
+        return estimator
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import json
+import os
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any, TextIO
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+from pyproj import CRS, Transformer
 
+from antevorta.config import CONFIG
 from antevorta.project import ProjectState, load_manifest, save_manifest
 from antevorta.io import read_events_csv
 
 
 REQUIRED_EVENT_COLUMNS = {"id", "latitude", "longitude", "timestamp"}
+GEOJSON_SEQ_SUFFIXES = {".geojsonl", ".geojsons"}
+READ_CHUNK_CHARS = 1 << 20
 
 
 def validate_events(events: pd.DataFrame) -> pd.DataFrame:
@@ -48,45 +57,213 @@ def _events_from_csv(events_path: Path, time_field: str) -> pd.DataFrame:
     return events
 
 
-def _events_from_geojson(events_path: Path, time_field: str) -> pd.DataFrame:
-    gdf = gpd.read_file(events_path)
-    if gdf.empty:
-        raise ValueError("Events GeoJSON has no features")
-    if gdf.geometry.is_empty.any():
-        raise ValueError("Events GeoJSON contains empty geometry")
-    if not gdf.geometry.geom_type.eq("Point").all():
-        raise ValueError("Events GeoJSON must contain Point geometries only")
-    if time_field not in gdf.columns:
-        raise ValueError(f"Events GeoJSON is missing required time field: {time_field}")
-
-    if gdf.crs is None:
-        gdf = gdf.set_crs(epsg=4326)
-    points = gdf.to_crs(epsg=4326)
-    events = pd.DataFrame(
+class _JsonStream:
+    """Incremental reader that decodes one JSON value at a time from a text file."""
+
+    def __init__(self, f: TextIO, chunk_chars: int = READ_CHUNK_CHARS) -> None:
+        self._f = f
+        self._chunk_chars = chunk_chars
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_chars)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at end of input."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Events GeoJSON is not valid JSON: expected '{char}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                # The value may just be cut off at the end of the buffer.
+                if self._fill():
+                    continue
+                raise ValueError(f"Events GeoJSON is not valid JSON: {exc}") from exc
+            # A number at the very end of the buffer may continue in the next chunk.
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def _iter_feature_collection(f: TextIO) -> Iterator[tuple[dict[str, Any], CRS | None]]:
+    """Yield features of a GeoJSON FeatureCollection one at a time.
+
+    Top-level members other than ``features`` are decoded whole; a legacy ``crs``
+    member must precede ``features`` to apply to them.
+    """
+    stream = _JsonStream(f)
+    crs: CRS | None = None
+    seen_features = False
+    stream.expect("{")
+    while stream.peek() != "}":
+        key = stream.value()
+        stream.expect(":")
+        if key == "features":
+            seen_features = True
+            stream.expect("[")
+            while stream.peek() != "]":
+                yield stream.value(), crs
+                if stream.peek() == ",":
+                    stream.expect(",")
+            stream.expect("]")
+        else:
+            member = stream.value()
+            if key == "crs":
+                if seen_features:
+                    raise ValueError("Events GeoJSON 'crs' member must precede 'features'")
+                crs = CRS.from_user_input(member["properties"]["name"])
+            elif key == "type" and member != "FeatureCollection":
+                raise ValueError("Events GeoJSON must be a FeatureCollection")
+        if stream.peek() == ",":
+            stream.expect(",")
+    stream.expect("}")
+
+
+def _iter_geojson_seq(f: TextIO) -> Iterator[tuple[dict[str, Any], CRS | None]]:
+    # RFC 8142 records may start with an ASCII record separator.
+    for line in f:
+        line = line.strip().lstrip("\x1e").strip()
+        if line:
+            yield json.loads(line), None
+
+
+def _iter_geojson_features(events_path: Path) -> Iterator[tuple[dict[str, Any], CRS | None]]:
+    with events_path.open("r", encoding="utf-8") as f:
+        if events_path.suffix.lower() in GEOJSON_SEQ_SUFFIXES:
+            yield from _iter_geojson_seq(f)
+        else:
+            yield from _iter_feature_collection(f)
+
+
+def _iter_geojson_batches(
+    events_path: Path,
+    time_field: str,
+    batch_size: int,
+) -> Iterator[tuple[np.ndarray, np.ndarray, list[Any], CRS | None]]:
+    xs: list[float] = []
+    ys: list[float] = []
+    times: list[Any] = []
+    batch_crs: CRS | None = None
+    for feature, crs in _iter_geojson_features(events_path):
+        geometry = feature.get("geometry")
+        if not geometry or not geometry.get("coordinates"):
+            raise ValueError("Events GeoJSON contains empty geometry")
+        if geometry.get("type") != "Point":
+            raise ValueError("Events GeoJSON must contain Point geometries only")
+        properties = feature.get("properties") or {}
+        if time_field not in properties:
+            raise ValueError(f"Events GeoJSON is missing required time field: {time_field}")
+        if xs and crs != batch_crs:
+            yield np.asarray(xs, dtype=float), np.asarray(ys, dtype=float), times, batch_crs
+            xs, ys, times = [], [], []
+        batch_crs = crs
+        coords = geometry["coordinates"]
+        xs.append(coords[0])
+        ys.append(coords[1])
+        times.append(properties[time_field])
+        if len(xs) >= batch_size:
+            yield np.asarray(xs, dtype=float), np.asarray(ys, dtype=float), times, batch_crs
+            xs, ys, times = [], [], []
+    if xs:
+        yield np.asarray(xs, dtype=float), np.asarray(ys, dtype=float), times, batch_crs
+
+
+def _validate_event_batch(
+    longitude: np.ndarray,
+    latitude: np.ndarray,
+    timestamps: list[Any],
+    first_id: int,
+) -> pd.DataFrame:
+    """Vectorized counterpart of ``validate_events`` for generated-id batches."""
+    if np.isnan(latitude).any() or np.isnan(longitude).any():
+        raise ValueError("Events GeoJSON has null coordinates")
+    if ((latitude < -90) | (latitude > 90)).any():
+        raise ValueError("Latitude must be between -90 and 90")
+    if ((longitude < -180) | (longitude > 180)).any():
+        raise ValueError("Longitude must be between -180 and 180")
+
+    ids = np.char.add("event_", np.arange(first_id, first_id + len(latitude)).astype(str))
+    return pd.DataFrame(
         {
-            "id": [f"event_{i + 1}" for i in range(len(points))],
-            "latitude": points.geometry.y.to_numpy(),
-            "longitude": points.geometry.x.to_numpy(),
-            "timestamp": points[time_field].to_numpy(),
+            "id": ids,
+            "latitude": latitude,
+            "longitude": longitude,
+            "timestamp": pd.to_datetime(pd.Series(timestamps), errors="raise", utc=True),
         }
     )
-    return events
+
+
+def _store_geojson_events(
+    events_path: Path,
+    time_field: str,
+    stored_path: Path,
+    batch_size: int = CONFIG.event_batch_size,
+) -> int:
+    """Stream GeoJSON or GeoJSONSeq events into the CSV event store in bounded batches.
+
+    Returns the number of events written. The store is replaced only after every
+    batch validated, so a bad feature leaves the previous events in place.
+    """
+    tmp_path = stored_path.with_name(stored_path.name + ".tmp")
+    written = 0
+    try:
+        with tmp_path.open("w", encoding="utf-8", newline="") as out:
+            for xs, ys, times, crs in _iter_geojson_batches(events_path, time_field, batch_size):
+                if crs is not None and not crs.equals(CRS.from_epsg(4326), ignore_axis_order=True):
+                    xs, ys = Transformer.from_crs(crs, "EPSG:4326", always_xy=True).transform(xs, ys)
+                batch = _validate_event_batch(np.asarray(xs), np.asarray(ys), times, written + 1)
+                batch.to_csv(out, index=False, header=written == 0)
+                written += len(batch)
+        if written == 0:
+            raise ValueError("Events GeoJSON has no features")
+        os.replace(tmp_path, stored_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return written
 
 
 def _load_events(events_path: Path, time_field: str) -> pd.DataFrame:
     suffix = events_path.suffix.lower()
     if suffix == ".csv":
         return _events_from_csv(events_path, time_field=time_field)
-    if suffix == ".geojson":
-        return _events_from_geojson(events_path, time_field=time_field)
-    raise ValueError("Events must be .csv or .geojson")
+    raise ValueError("Events must be .csv, .geojson, .geojsonl or .geojsons")
 
 
 def add_events(state: ProjectState, events_path: Path, time_field: str = "timestamp") -> Path:
     manifest = load_manifest(state)
-    events = validate_events(_load_events(events_path, time_field=time_field))
     stored_path = state.data_dir / "events.csv"
-    events.to_csv(stored_path, index=False)
+    suffix = events_path.suffix.lower()
+    if suffix == ".geojson" or suffix in GEOJSON_SEQ_SUFFIXES:
+        _store_geojson_events(events_path, time_field, stored_path)
+    else:
+        events = validate_events(_load_events(events_path, time_field=time_field))
+        events.to_csv(stored_path, index=False)
     manifest["events_path"] = str(stored_path.resolve())
     save_manifest(state, manifest)
     return stored_path
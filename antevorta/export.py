@@ -3,27 +3,73 @@ from __future__ import annotations
 from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 
-from antevorta.io import write_dataframe_csv
+from antevorta.bootstrap import BootstrapResult
+from antevorta.io import PARQUET_ROW_GROUP_SIZE, write_dataframe_csv
+
+
+LIKELIHOOD_FORMATS = {
+    "geojson": "likelihood_grid.geojson",
+    "flatgeobuf": "likelihood_grid.fgb",
+    "geoparquet": "likelihood_grid.parquet",
+}
+
+
+def likelihood_layer(ranked_grid: pd.DataFrame) -> gpd.GeoDataFrame:
+    """Point layer of the ranked grid in cell_id order, built from its coordinate columns."""
+    cells = ranked_grid.sort_values("cell_id", kind="stable")
+    return gpd.GeoDataFrame(
+        {
+            "cell_id": cells["cell_id"].to_numpy(),
+            "probability": cells["probability"].to_numpy(),
+            "likelihood": cells["likelihood"].to_numpy(),
+        },
+        geometry=gpd.points_from_xy(cells["longitude"].to_numpy(), cells["latitude"].to_numpy()),
+        crs="EPSG:4326",
+    )
+
+
+def write_likelihood_layer(layer: gpd.GeoDataFrame, path: Path, fmt: str) -> None:
+    """Write the likelihood layer through pyogrio's Arrow path or as GeoParquet.
+
+    FlatGeobuf gets an embedded packed Hilbert R-tree. GeoParquet rows are sorted
+    along a Hilbert curve and carry a bbox covering column, so row-group statistics
+    support bbox-filtered partial reads.
+    """
+    if fmt == "geojson":
+        layer.to_file(path, driver="GeoJSON", engine="pyogrio", use_arrow=True)
+    elif fmt == "flatgeobuf":
+        layer.to_file(path, driver="FlatGeobuf", engine="pyogrio", use_arrow=True, SPATIAL_INDEX="YES")
+    elif fmt == "geoparquet":
+        order = np.argsort(layer.hilbert_distance().to_numpy(), kind="stable")
+        layer.iloc[order].to_parquet(
+            path,
+            index=False,
+            write_covering_bbox=True,
+            row_group_size=PARQUET_ROW_GROUP_SIZE,
+        )
+    else:
+        allowed = ", ".join(LIKELIHOOD_FORMATS)
+        raise ValueError(f"Unsupported output format {fmt}. Allowed: {allowed}")
 
 
 def export_assessment(
-    grid_wgs84: gpd.GeoDataFrame,
     ranked_grid: pd.DataFrame,
     weights: pd.DataFrame,
     output_dir: Path,
+    fmt: str = "geojson",
 ) -> dict[str, Path]:
-    lookup = ranked_grid.set_index("cell_id")
-    geo = grid_wgs84[["cell_id", "geometry"]].copy()
-    geo["probability"] = geo["cell_id"].map(lookup["probability"])
-    geo["likelihood"] = geo["cell_id"].map(lookup["likelihood"])
+    if fmt not in LIKELIHOOD_FORMATS:
+        allowed = ", ".join(LIKELIHOOD_FORMATS)
+        raise ValueError(f"Unsupported output format {fmt}. Allowed: {allowed}")
 
-    likelihood_path = output_dir / "likelihood_grid.geojson"
+    likelihood_path = output_dir / LIKELIHOOD_FORMATS[fmt]
     ranked_path = output_dir / "ranked_grid.csv"
     weights_path = output_dir / "factor_weights.csv"
 
-    geo.to_file(likelihood_path, driver="GeoJSON")
+    write_likelihood_layer(likelihood_layer(ranked_grid), likelihood_path, fmt)
     write_dataframe_csv(ranked_grid, ranked_path)
     write_dataframe_csv(weights, weights_path)
 
@@ -32,3 +78,16 @@ def export_assessment(
         "ranked_grid": ranked_path,
         "factor_weights": weights_path,
     }
+
+
+def export_bootstrap(result: BootstrapResult, output_dir: Path) -> dict[str, Path]:
+    uncertainty_path = output_dir / "likelihood_uncertainty.csv"
+    weights_path = output_dir / "factor_weights_ci.csv"
+
+    write_dataframe_csv(result.grid, uncertainty_path)
+    write_dataframe_csv(result.weights, weights_path)
+
+    return {
+        "likelihood_uncertainty": uncertainty_path,
+        "factor_weights_ci": weights_path,
+    }
@@ -1,13 +1,89 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
 import numpy as np
+from pyproj import CRS
+from shapely import STRtree
+from sklearn.neighbors import KDTree
 
+from antevorta.cache import SharedCache
+from antevorta.events import load_events_geodataframe
+from antevorta.grid import load_project_aoi
 from antevorta.project import ProjectState, load_manifest, save_manifest
-from antevorta.io import copy_file, validate_factor_extension
+from antevorta.io import PARQUET_ROW_GROUP_SIZE, copy_file, ensure_dir, file_digest, validate_factor_extension
+from antevorta.spatial import GridLattice, buffered_bounds
+
+
+EVENT_DENSITY_KERNELS = ("count", "gaussian", "epanechnikov")
+ZONAL_STATS = ("mean", "max", "fraction")
+
+
+@dataclass(frozen=True)
+class VectorLayer:
+    """Factor geometries in one CRS with an STRtree for nearest-geometry queries."""
+
+    geometries: np.ndarray
+    tree: STRtree
+
+    @classmethod
+    def from_geometries(cls, geometries: np.ndarray) -> "VectorLayer":
+        return cls(geometries=geometries, tree=STRtree(geometries))
+
+    def distance(self, points: np.ndarray, max_distance: float | None = None) -> np.ndarray:
+        """Distance to the nearest geometry; inf beyond ``max_distance`` or with no geometries."""
+        # Nearest-geometry distance equals the distance to the union of the layer.
+        (point_idx, _), distances = self.tree.query_nearest(
+            points,
+            max_distance=max_distance,
+            return_distance=True,
+            all_matches=False,
+        )
+        out = np.full(len(points), np.inf, dtype=float)
+        out[point_idx] = distances
+        return out
+
+
+# Process-wide caches shared by every project, so a factor used by many projects is
+# hashed, read and indexed once per CRS.
+_DIGESTS: SharedCache[str] = SharedCache(maxsize=256)
+_VECTOR_SOURCES: SharedCache[gpd.GeoDataFrame] = SharedCache(maxsize=8)
+_VECTOR_LAYERS: SharedCache[VectorLayer] = SharedCache(maxsize=32)
+_EVENT_FILES: SharedCache[gpd.GeoDataFrame] = SharedCache(maxsize=4)
+_EVENT_TREES: SharedCache[KDTree] = SharedCache(maxsize=8)
+
+
+@dataclass(frozen=True)
+class ZonalTable:
+    """Per-lattice-cell pixel aggregates of a raster, indexed by flat lattice index."""
+
+    count: np.ndarray
+    total: np.ndarray
+    maximum: np.ndarray
+    above: np.ndarray
+
+    def values(self, stat: str) -> np.ndarray:
+        """Statistic per cell; NaN where no pixel centre falls inside the cell."""
+        empty = self.count == 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if stat == "mean":
+                out = self.total / self.count
+            elif stat == "max":
+                out = self.maximum.copy()
+            elif stat == "fraction":
+                out = self.above / self.count
+            else:
+                raise ValueError(f"Unknown zonal statistic: {stat}")
+        out[empty] = np.nan
+        return out
+
+
+_ZONAL_TABLES: SharedCache[ZonalTable] = SharedCache(maxsize=8)
 
 
 def _factor_name(path: Path) -> str:
@@ -21,39 +97,220 @@ def _infer_factor_source(path: Path) -> str:
     return "vector"
 
 
-def _copy_factor_files(factor_path: Path, factors_dir: Path) -> Path:
+def _factor_files(factor_path: Path) -> list[Path]:
     if factor_path.suffix.lower() == ".shp":
-        stem = factor_path.stem
-        for src in factor_path.parent.glob(f"{stem}.*"):
-            copy_file(src, factors_dir / src.name)
-        return factors_dir / factor_path.name
-    return copy_file(factor_path, factors_dir / factor_path.name)
+        return sorted(factor_path.parent.glob(f"{factor_path.stem}.*"))
+    return [factor_path]
 
 
-def add_factor(state: ProjectState, factor_path: Path, factor_type: str) -> dict[str, Any]:
+def _copy_factor_files(factor_path: Path, factors_dir: Path) -> Path:
+    """Store factor files content-addressed under ``factors_dir/<sha256>/``.
+
+    Registering files that are already stored reuses the existing copy.
+    """
+    sources = _factor_files(factor_path)
+    target_dir = factors_dir / file_digest(sources)
+    for src in sources:
+        if not (target_dir / src.name).exists():
+            copy_file(src, target_dir / src.name)
+    return target_dir / factor_path.name
+
+
+def _content_key(factor_path: Path) -> str:
+    stat = factor_path.stat()
+    key = (str(factor_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    return _DIGESTS.get(key, lambda: file_digest(_factor_files(factor_path)))
+
+
+def factor_fingerprint(factor: dict[str, Any]) -> str:
+    """Hash of a factor's settings and source content, independent of where it is stored."""
+    spec = {key: value for key, value in factor.items() if key != "path"}
+    payload = json.dumps(spec, sort_keys=True) + _content_key(Path(str(factor["path"])))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _prepare_vector_factor(
+    factor_path: Path,
+    factors_dir: Path,
+    crs: CRS,
+    simplify_m: float,
+) -> Path:
+    """Reproject and simplify a vector factor once and store it as GeoParquet.
+
+    Geometries are written in Hilbert-curve order, in bounded row groups, with a bbox
+    covering column, so each group is spatially compact and scoring reads just the
+    groups near its points. The result is stored under a hash of the source content
+    and these settings, so identical registrations, from any project, reuse it.
+    """
+    settings = {"crs": crs.to_wkt(), "simplify_m": simplify_m, "row_group_size": PARQUET_ROW_GROUP_SIZE}
+    payload = file_digest(_factor_files(factor_path)) + json.dumps(settings, sort_keys=True)
+    target = factors_dir / hashlib.sha256(payload.encode("utf-8")).hexdigest() / f"{factor_path.stem}.parquet"
+    if target.exists():
+        return target
+
+    geoms = _read_vector_factor(factor_path).to_crs(crs).geometry
+    if simplify_m > 0:
+        geoms = geoms.simplify(simplify_m, preserve_topology=True)
+    geoms = geoms.dropna()
+    geoms = geoms[~geoms.is_empty]
+    if geoms.empty:
+        raise ValueError(f"Factor has no features: {factor_path}")
+
+    prepared = gpd.GeoDataFrame(geometry=geoms.to_numpy(), crs=crs)
+    prepared = prepared.iloc[np.argsort(prepared.hilbert_distance().to_numpy(), kind="stable")]
+    ensure_dir(target.parent)
+    prepared.to_parquet(
+        target,
+        index=False,
+        write_covering_bbox=True,
+        row_group_size=PARQUET_ROW_GROUP_SIZE,
+    )
+    return target
+
+
+def add_factor(
+    state: ProjectState,
+    factor_path: Path,
+    factor_type: str,
+    max_distance_m: float | None = None,
+    simplify_m: float = 0.0,
+) -> dict[str, Any]:
     if factor_type != "distance":
         raise ValueError("Only factor type 'distance' is supported")
+    if max_distance_m is not None and max_distance_m <= 0:
+        raise ValueError("Maximum distance must be > 0 meters")
+    if simplify_m < 0:
+        raise ValueError("Simplification tolerance must be >= 0 meters")
 
     validate_factor_extension(factor_path)
     manifest = load_manifest(state)
-    stored = _copy_factor_files(factor_path, state.factors_dir)
-    source = _infer_factor_source(stored)
+    source = _infer_factor_source(factor_path)
+
+    if source == "vector":
+        aoi_metric = load_project_aoi(state).gdf_metric
+        crs = aoi_metric.crs.to_string()
+        stored = _prepare_vector_factor(factor_path, state.factors_dir, aoi_metric.crs, simplify_m)
+        factor = {
+            "name": _factor_name(factor_path),
+            "path": str(stored.resolve()),
+            "source": source,
+            "metric": "distance",
+            "crs": crs,
+            "max_distance_m": max_distance_m,
+            "simplify_m": simplify_m,
+            # Features beyond the AOI plus max_distance_m cannot be the nearest within
+            # max_distance_m of any cell; rebuilding the grid re-targets this window.
+            "clip_bounds": (
+                None
+                if max_distance_m is None
+                else buffered_bounds(aoi_metric.total_bounds, crs, max_distance_m, crs)
+            ),
+        }
+    else:
+        stored = _copy_factor_files(factor_path, state.factors_dir)
+        factor = {
+            "name": _factor_name(stored),
+            "path": str(stored.resolve()),
+            "source": source,
+            "metric": "raster_value",
+            # Pixels over the grid lattice are read once per assessment; rebuilding the
+            # grid re-targets this.
+            "lattice": manifest.get("grid_lattice"),
+        }
+
+    _register_factors(manifest, [factor])
+    save_manifest(state, manifest)
+    return factor
+
+
+def add_event_density_factors(
+    state: ProjectState,
+    radii: list[float],
+    kernel: str = "count",
+) -> list[dict[str, Any]]:
+    """Register one event-density factor per radius, derived from the project events.
+
+    ``count`` scores the number of historical events within ``radius_m``; the other
+    kernels score a kernel-weighted neighbour count using ``radius_m`` as the bandwidth,
+    where an event at distance 0 weighs 1.
+    """
+    if kernel not in EVENT_DENSITY_KERNELS:
+        allowed = ", ".join(EVENT_DENSITY_KERNELS)
+        raise ValueError(f"Unsupported event-density kernel {kernel}. Allowed: {allowed}")
+    if len(radii) == 0:
+        raise ValueError("At least one radius is required for event-density factors")
+    if any(radius <= 0 for radius in radii):
+        raise ValueError("Event-density radius must be > 0 meters")
+
+    manifest = load_manifest(state)
+    events_path = manifest.get("events_path")
+    if not isinstance(events_path, str):
+        raise ValueError("Events missing. Run: antevorta add-events <events-file>")
+
+    factors = [
+        {
+            "name": f"events_{kernel}_{radius:g}m",
+            "path": events_path,
+            "source": "events",
+            "metric": "event_count" if kernel == "count" else "kernel_density",
+            "kernel": kernel,
+            "radius_m": float(radius),
+        }
+        for radius in sorted(set(radii))
+    ]
+    _register_factors(manifest, factors)
+    save_manifest(state, manifest)
+    return factors
 
+
+def add_zonal_factor(
+    state: ProjectState,
+    factor_path: Path,
+    stat: str,
+    threshold: float | None = None,
+) -> dict[str, Any]:
+    """Register a raster factor scored by a statistic over each grid cell's footprint.
+
+    Points take the statistic of the grid lattice cell they fall in. ``fraction`` is
+    the share of the cell's pixels above ``threshold``.
+    """
+    if stat not in ZONAL_STATS:
+        allowed = ", ".join(ZONAL_STATS)
+        raise ValueError(f"Unsupported zonal statistic {stat}. Allowed: {allowed}")
+    if stat == "fraction" and threshold is None:
+        raise ValueError("Zonal statistic 'fraction' requires a threshold")
+    validate_factor_extension(factor_path)
+    if _infer_factor_source(factor_path) != "raster":
+        raise ValueError("Zonal factors require a raster (.tif/.tiff)")
+
+    manifest = load_manifest(state)
+    lattice = manifest.get("grid_lattice")
+    if not isinstance(lattice, dict):
+        raise ValueError("Grid not found. Run: antevorta build-grid --resolution <meters>")
+
+    stored = _copy_factor_files(factor_path, state.factors_dir)
     factor = {
-        "name": _factor_name(stored),
+        "name": f"{_factor_name(stored)}_{stat}",
         "path": str(stored.resolve()),
-        "source": source,
-        "metric": "distance" if source == "vector" else "raster_value",
+        "source": "raster",
+        "metric": f"zonal_{stat}",
+        "stat": stat,
+        "threshold": threshold,
+        "lattice": lattice,
     }
+    _register_factors(manifest, [factor])
+    save_manifest(state, manifest)
+    return factor
 
+
+def _register_factors(manifest: dict[str, object], factors: list[dict[str, Any]]) -> None:
     existing = manifest.get("factors", [])
     if not isinstance(existing, list):
         raise ValueError("Invalid project manifest: factors must be a list")
-    existing = [x for x in existing if x.get("name") != factor["name"]]
-    existing.append(factor)
+    names = {factor["name"] for factor in factors}
+    existing = [x for x in existing if x.get("name") not in names]
+    existing.extend(factors)
     manifest["factors"] = existing
-    save_manifest(state, manifest)
-    return factor
 
 
 def load_factors(state: ProjectState) -> list[dict[str, Any]]:
@@ -66,24 +323,194 @@ def load_factors(state: ProjectState) -> list[dict[str, Any]]:
     return factors
 
 
-def _score_vector_distance(points_metric: gpd.GeoDataFrame, factor_path: Path) -> np.ndarray:
-    factor = gpd.read_file(factor_path)
-    if factor.empty:
+def _read_vector_factor(factor_path: Path, bbox: tuple[float, ...] | None = None) -> gpd.GeoDataFrame:
+    """Read a vector factor, or only its features intersecting ``bbox`` in its own CRS."""
+    if factor_path.suffix.lower() == ".parquet":
+        factor = gpd.read_parquet(factor_path, bbox=bbox)
+    else:
+        factor = gpd.read_file(factor_path, bbox=bbox)
+    if factor.empty and bbox is None:
         raise ValueError(f"Factor has no features: {factor_path}")
     if factor.crs is None:
         raise ValueError(f"Vector factor missing CRS: {factor_path}")
-    geom = factor.to_crs(points_metric.crs).geometry.unary_union
-    distances = points_metric.geometry.distance(geom).to_numpy(dtype=float)
-    return distances
+    return factor
+
+
+def _vector_source(factor_path: Path, window: tuple[float, ...] | None = None) -> gpd.GeoDataFrame:
+    key = (_content_key(factor_path), window)
+    return _VECTOR_SOURCES.get(key, lambda: _read_vector_factor(factor_path, window))
+
+
+def reserve_factor_caches(n_factors: int) -> None:
+    """Size the shared caches so that ``n_factors`` factors never evict each other."""
+    for cache in (_VECTOR_SOURCES, _RASTER_WINDOWS, _ZONAL_TABLES):
+        cache.reserve(n_factors)
+    # Vector layers are indexed per scoring CRS, usually the grid's and the events'.
+    _VECTOR_LAYERS.reserve(2 * n_factors)
+
+
+def preload_factor_source(factor: dict[str, Any], crs: CRS | None = None) -> None:
+    """Read and index what scoring ``factor`` uses, ahead of scoring.
+
+    Vector factors are read within their clip window and indexed in ``crs``, the
+    grid's metric CRS. Raster factors are read over their grid lattice, and zonal
+    ones aggregated into their cell table. Event-density factors depend on the
+    selected events and are covered by ``preload_event_trees``.
+    """
+    source = str(factor["source"])
+    factor_path = Path(str(factor["path"]))
+    if source == "vector":
+        clip_bounds = factor.get("clip_bounds")
+        window = None if clip_bounds is None else tuple(clip_bounds)
+        if crs is None:
+            _vector_source(factor_path, window)
+        else:
+            load_vector_layer(factor_path, crs, window)
+    elif source == "raster":
+        lattice = _factor_lattice(factor)
+        if lattice is None:
+            return
+        if "stat" in factor:
+            _zonal_table(factor, lattice)
+        else:
+            _raster_window(factor_path, lattice)
+
+
+def preload_event_trees(events: gpd.GeoDataFrame, crs_list: list[CRS]) -> None:
+    """Build the event-density KD-trees over ``events`` in each scoring CRS."""
+    if len(events) == 0:
+        return
+    for crs in crs_list:
+        _event_tree(events, crs)
+
 
+def load_vector_layer(factor_path: Path, crs: CRS, window: tuple[float, ...] | None = None) -> VectorLayer:
+    """Factor geometries projected to ``crs``; only those intersecting ``window`` if given."""
 
-def _score_raster_value(points_wgs84: gpd.GeoDataFrame, factor_path: Path) -> np.ndarray:
+    def project() -> VectorLayer:
+        geoms = _vector_source(factor_path, window).to_crs(crs).geometry
+        geoms = geoms.dropna()
+        geoms = geoms[~geoms.is_empty]
+        if geoms.empty and window is None:
+            raise ValueError(f"Factor has no features: {factor_path}")
+        return VectorLayer.from_geometries(geoms.to_numpy())
+
+    return _VECTOR_LAYERS.get((_content_key(factor_path), window, crs.to_wkt()), project)
+
+
+def _clip_window(points_metric: gpd.GeoDataFrame, factor: dict[str, Any]) -> tuple[float, ...]:
+    """Window of the factor's CRS holding every feature within max_distance_m of the points.
+
+    This is the factor's ``clip_bounds`` unless some points lie outside it, such as
+    events beyond the AOI; then it is grown to cover them too.
+    """
+    max_distance_m = float(factor["max_distance_m"])
+    needed = buffered_bounds(points_metric.total_bounds, points_metric.crs.to_wkt(), max_distance_m, factor["crs"])
+    clip_bounds = factor.get("clip_bounds")
+    if clip_bounds is None:
+        return tuple(needed)
+    inner = np.asarray(needed)
+    outer = np.asarray(clip_bounds, dtype=float)
+    if (inner[:2] >= outer[:2]).all() and (inner[2:] <= outer[2:]).all():
+        return tuple(clip_bounds)
+    return tuple(float(v) for v in np.r_[np.minimum(inner[:2], outer[:2]), np.maximum(inner[2:], outer[2:])])
+
+
+def _score_vector_distance(points_metric: gpd.GeoDataFrame, factor: dict[str, Any]) -> np.ndarray:
+    factor_path = Path(str(factor["path"]))
+    points = points_metric.geometry.to_numpy()
+    max_distance_m = factor.get("max_distance_m")
+    if max_distance_m is None:
+        return load_vector_layer(factor_path, points_metric.crs).distance(points)
+
+    # Distances are capped, so only features within the cap of the points are read.
+    layer = load_vector_layer(factor_path, points_metric.crs, _clip_window(points_metric, factor))
+    return np.minimum(layer.distance(points, float(max_distance_m)), float(max_distance_m))
+
+
+def _import_rasterio():
     try:
         import rasterio
     except ModuleNotFoundError as exc:
         raise ModuleNotFoundError(
             "rasterio is required for raster factors (.tif/.tiff). Install rasterio to use this factor type."
         ) from exc
+    return rasterio
+
+
+@dataclass(frozen=True)
+class RasterWindow:
+    """Band 1 of a raster over a lattice's extent, held in memory for point sampling."""
+
+    values: np.ndarray
+    transform: Any
+    crs: str
+
+    def sample(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Pixel value under each coordinate (NaN for nodata) and whether it is inside."""
+        cols, rows = ~self.transform * (np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        rows = np.floor(rows).astype(np.int64)
+        cols = np.floor(cols).astype(np.int64)
+        height, width = self.values.shape
+        inside = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+        out = np.full(len(rows), np.nan)
+        out[inside] = self.values[rows[inside], cols[inside]]
+        return out, inside
+
+
+_RASTER_WINDOWS: SharedCache[RasterWindow] = SharedCache(maxsize=8)
+
+
+def _lattice_window(src: Any, lattice: GridLattice) -> Any:
+    """Pixel window of ``src`` covering the lattice plus a pixel, or None if disjoint."""
+    rasterio = _import_rasterio()
+    from rasterio.warp import transform_bounds
+    from rasterio.windows import Window, from_bounds
+
+    lattice_bounds = transform_bounds(
+        lattice.crs,
+        src.crs,
+        lattice.origin_x,
+        lattice.origin_y,
+        lattice.origin_x + lattice.nx * lattice.resolution_m,
+        lattice.origin_y + lattice.ny * lattice.resolution_m,
+        densify_pts=21,
+    )
+    try:
+        bounds = from_bounds(*lattice_bounds, transform=src.transform)
+        # Pad by a pixel so partially covered edge pixels are read too.
+        return Window(
+            int(np.floor(bounds.col_off)) - 1,
+            int(np.floor(bounds.row_off)) - 1,
+            int(np.ceil(bounds.width)) + 3,
+            int(np.ceil(bounds.height)) + 3,
+        ).intersection(Window(0, 0, src.width, src.height))
+    except rasterio.errors.WindowError:
+        return None
+
+
+def _read_raster_window(factor_path: Path, lattice: GridLattice) -> RasterWindow:
+    rasterio = _import_rasterio()
+    with rasterio.open(factor_path) as src:
+        window = _lattice_window(src, lattice)
+        if window is None:
+            values = np.empty((0, 0))
+            transform = src.transform
+        else:
+            values = src.read(1, window=window).astype(float)
+            transform = src.window_transform(window)
+        if src.nodata is not None:
+            values[values == src.nodata] = np.nan
+        return RasterWindow(values=values, transform=transform, crs=src.crs.to_wkt())
+
+
+def _raster_window(factor_path: Path, lattice: GridLattice) -> RasterWindow:
+    key = (_content_key(factor_path), lattice)
+    return _RASTER_WINDOWS.get(key, lambda: _read_raster_window(factor_path, lattice))
+
+
+def _sample_raster(points_wgs84: gpd.GeoDataFrame, factor_path: Path) -> np.ndarray:
+    rasterio = _import_rasterio()
 
     with rasterio.open(factor_path) as src:
         points = points_wgs84.to_crs(src.crs)
@@ -94,6 +521,23 @@ def _score_raster_value(points_wgs84: gpd.GeoDataFrame, factor_path: Path) -> np
         nodata = src.nodata
         if nodata is not None:
             arr = np.where(arr == nodata, np.nan, arr)
+    return arr
+
+
+def _score_raster_value(
+    points_wgs84: gpd.GeoDataFrame,
+    factor_path: Path,
+    lattice: GridLattice | None = None,
+) -> np.ndarray:
+    if lattice is None:
+        arr = _sample_raster(points_wgs84, factor_path)
+    else:
+        window = _raster_window(factor_path, lattice)
+        points = points_wgs84.to_crs(window.crs)
+        arr, inside = window.sample(points.geometry.x.to_numpy(), points.geometry.y.to_numpy())
+        if not inside.all():
+            # Points beyond the lattice, such as outlying events, are sampled from the file.
+            arr[~inside] = _sample_raster(points_wgs84.iloc[np.flatnonzero(~inside)], factor_path)
 
     if np.isnan(arr).any():
         # Keep deterministic behavior while handling sparse nodata samples.
@@ -102,15 +546,167 @@ def _score_raster_value(points_wgs84: gpd.GeoDataFrame, factor_path: Path) -> np
     return arr
 
 
+def _compute_zonal_table(factor_path: Path, lattice: GridLattice, threshold: float | None) -> ZonalTable:
+    """Aggregate raster pixels into lattice cells in one block-by-block pass.
+
+    Each pixel centre is mapped to its cell's flat index; per-block sums, maxima and
+    threshold counts are reduced with ``reduceat`` over the sorted indices, so the
+    work per block is proportional to the block, not the lattice.
+    """
+    rasterio = _import_rasterio()
+    from pyproj import Transformer
+
+    count = np.zeros(lattice.size, dtype=np.int64)
+    total = np.zeros(lattice.size, dtype=float)
+    maximum = np.full(lattice.size, -np.inf)
+    above = np.zeros(lattice.size, dtype=np.int64)
+
+    with rasterio.open(factor_path) as src:
+        to_lattice = Transformer.from_crs(src.crs.to_wkt(), lattice.crs, always_xy=True)
+        target = _lattice_window(src, lattice)
+        # A raster that does not overlap the lattice contributes no blocks.
+        blocks = [] if target is None else [block for _, block in src.block_windows(1)]
+
+        for block in blocks:
+            try:
+                window = block.intersection(target)
+            except rasterio.errors.WindowError:
+                continue
+
+            data = src.read(1, window=window, masked=True)
+            rows, cols = np.mgrid[0 : data.shape[0], 0 : data.shape[1]]
+            t = src.window_transform(window)
+            xs = t.a * (cols + 0.5) + t.b * (rows + 0.5) + t.c
+            ys = t.d * (cols + 0.5) + t.e * (rows + 0.5) + t.f
+            x, y = to_lattice.transform(xs.ravel(), ys.ravel())
+
+            idx = lattice.flat_index(x, y)
+            values = np.ma.getdata(data).ravel().astype(float)
+            valid = (idx >= 0) & ~np.ma.getmaskarray(data).ravel() & np.isfinite(values)
+            if not valid.any():
+                continue
+            idx = idx[valid]
+            values = values[valid]
+
+            order = np.argsort(idx, kind="stable")
+            idx = idx[order]
+            values = values[order]
+            starts = np.flatnonzero(np.r_[True, idx[1:] != idx[:-1]])
+            cells = idx[starts]
+            count[cells] += np.diff(np.r_[starts, len(idx)])
+            total[cells] += np.add.reduceat(values, starts)
+            maximum[cells] = np.maximum(maximum[cells], np.maximum.reduceat(values, starts))
+            if threshold is not None:
+                above[cells] += np.add.reduceat((values > threshold).astype(np.int64), starts)
+
+    return ZonalTable(count=count, total=total, maximum=maximum, above=above)
+
+
+def _factor_lattice(factor: dict[str, Any]) -> GridLattice | None:
+    lattice = factor.get("lattice")
+    return GridLattice.from_dict(lattice) if isinstance(lattice, dict) else None
+
+
+def _zonal_table(factor: dict[str, Any], lattice: GridLattice) -> ZonalTable:
+    factor_path = Path(str(factor["path"]))
+    threshold = None if factor.get("threshold") is None else float(factor["threshold"])
+    key = (_content_key(factor_path), lattice, threshold)
+    return _ZONAL_TABLES.get(key, lambda: _compute_zonal_table(factor_path, lattice, threshold))
+
+
+def _score_raster_zonal(points_wgs84: gpd.GeoDataFrame, factor: dict[str, Any]) -> np.ndarray:
+    factor_path = Path(str(factor["path"]))
+    lattice = GridLattice.from_dict(factor["lattice"])
+    stat = str(factor["stat"])
+    table = _zonal_table(factor, lattice)
+
+    points = points_wgs84.to_crs(lattice.crs)
+    idx = lattice.flat_index(points.geometry.x.to_numpy(), points.geometry.y.to_numpy())
+    values = np.full(len(idx), np.nan)
+    inside = idx >= 0
+    values[inside] = table.values(stat)[idx[inside]]
+
+    missing = np.isnan(values)
+    if missing.any():
+        # Cells without a pixel centre (raster coarser than the grid, or points off the
+        # lattice) fall back to sampling the pixel under the point.
+        sampled = _score_raster_value(points_wgs84.iloc[np.flatnonzero(missing)], factor_path, lattice)
+        threshold = factor.get("threshold")
+        values[missing] = (sampled > float(threshold)).astype(float) if stat == "fraction" else sampled
+    return values
+
+
+def _events_file(events_path: Path) -> gpd.GeoDataFrame:
+    if not events_path.exists():
+        raise FileNotFoundError(f"Events file not found: {events_path}")
+    # mtime is part of the key so re-added events are read again.
+    key = (str(events_path.resolve()), events_path.stat().st_mtime_ns)
+    return _EVENT_FILES.get(key, lambda: load_events_geodataframe(events_path))
+
+
+def _event_tree(events: gpd.GeoDataFrame, crs: CRS) -> KDTree:
+    """KD-tree over ``events`` in ``crs``, shared by every caller passing the same events."""
+    coords = np.column_stack([events.geometry.x.to_numpy(), events.geometry.y.to_numpy()])
+
+    def build() -> KDTree:
+        metric = events.to_crs(crs)
+        return KDTree(np.column_stack([metric.geometry.x.to_numpy(), metric.geometry.y.to_numpy()]))
+
+    key = (hashlib.sha256(coords.tobytes()).hexdigest(), events.crs.to_wkt(), crs.to_wkt())
+    return _EVENT_TREES.get(key, build)
+
+
+def _score_event_density(
+    points_metric: gpd.GeoDataFrame,
+    factor: dict[str, Any],
+    exclude_self: bool,
+    events: gpd.GeoDataFrame | None = None,
+) -> np.ndarray:
+    if events is None:
+        events = _events_file(Path(str(factor["path"])))
+    coords = np.column_stack([points_metric.geometry.x.to_numpy(), points_metric.geometry.y.to_numpy()])
+    radius = float(factor["radius_m"])
+    kernel = str(factor["kernel"])
+    if len(events) == 0:
+        return np.zeros(len(coords))
+
+    tree = _event_tree(events, points_metric.crs)
+    if kernel == "count":
+        values = tree.query_radius(coords, r=radius, count_only=True).astype(float)
+    else:
+        # Scale the area-normalised density by its value at distance 0, so each event
+        # contributes at most 1 and scores stay in neighbour-count units.
+        origin = np.zeros((1, 2))
+        self_weight = float(KDTree(origin).kernel_density(origin, h=radius, kernel=kernel)[0])
+        values = tree.kernel_density(coords, h=radius, kernel=kernel) / self_weight
+
+    if exclude_self:
+        # Query points are the events themselves; drop the zero-distance self match.
+        values = np.maximum(values - 1.0, 0.0)
+    return values
+
+
 def score_points_for_factor(
     points_wgs84: gpd.GeoDataFrame,
     points_metric: gpd.GeoDataFrame,
     factor: dict[str, Any],
+    exclude_self: bool = False,
+    events: gpd.GeoDataFrame | None = None,
 ) -> np.ndarray:
-    factor_path = Path(str(factor["path"]))
+    """Score points for one factor.
+
+    ``events`` are the events event-density factors count; by default, every event
+    in the factor's events file.
+    """
     source = str(factor["source"])
+    if source == "events":
+        return _score_event_density(points_metric, factor, exclude_self, events)
+
+    factor_path = Path(str(factor["path"]))
     if source == "vector":
-        return _score_vector_distance(points_metric, factor_path)
+        return _score_vector_distance(points_metric, factor)
+    if source == "raster" and "stat" in factor:
+        return _score_raster_zonal(points_wgs84, factor)
     if source == "raster":
-        return _score_raster_value(points_wgs84, factor_path)
+        return _score_raster_value(points_wgs84, factor_path, _factor_lattice(factor))
     raise ValueError(f"Unknown factor source: {source}")
@@ -5,7 +5,7 @@ from pathlib import Path
 import geopandas as gpd
 
 from antevorta.project import ProjectState, load_manifest, save_manifest
-from antevorta.spatial import as_metric, make_grid, require_wgs84
+from antevorta.spatial import LatticeGrid, SpatialBundle, as_metric, buffered_bounds, require_wgs84
 
 
 def load_aoi(aoi_path: Path) -> gpd.GeoDataFrame:
@@ -22,35 +22,49 @@ def load_aoi(aoi_path: Path) -> gpd.GeoDataFrame:
     return aoi
 
 
-def build_grid(state: ProjectState, resolution_m: float) -> Path:
-    if resolution_m <= 0:
-        raise ValueError("Resolution must be > 0 meters")
-
+def load_project_aoi(state: ProjectState) -> SpatialBundle:
     manifest = load_manifest(state)
     aoi_path = manifest.get("aoi_path")
     if not isinstance(aoi_path, str):
         raise ValueError("Project is missing AOI path")
+    return as_metric(load_aoi(Path(aoi_path)))
+
 
-    aoi = load_aoi(Path(aoi_path))
-    bundle = as_metric(aoi)
-    grid_metric = make_grid(bundle.gdf_metric, resolution_m)
-    grid_wgs84 = grid_metric.to_crs(epsg=4326)
-    grid_wgs84["latitude"] = grid_wgs84.geometry.y
-    grid_wgs84["longitude"] = grid_wgs84.geometry.x
+def build_grid(state: ProjectState, resolution_m: float) -> Path:
+    if resolution_m <= 0:
+        raise ValueError("Resolution must be > 0 meters")
+
+    manifest = load_manifest(state)
+    bundle = load_project_aoi(state)
+    grid = LatticeGrid.from_aoi(bundle.gdf_metric, resolution_m)
 
-    grid_path = state.data_dir / "grid.geojson"
-    grid_wgs84.to_file(grid_path, driver="GeoJSON")
+    grid_path = state.data_dir / "grid.npz"
+    grid.save(grid_path)
     manifest["grid_path"] = str(grid_path.resolve())
+    manifest["grid_resolution_m"] = float(resolution_m)
+    lattice = grid.lattice.to_dict()
+    manifest["grid_lattice"] = lattice
+    # Zonal factors aggregate over the grid's cells and clipped vector factors read the
+    # features near them, so both follow the grid, including one copied from a template.
+    aoi_bounds = bundle.gdf_metric.total_bounds
+    aoi_crs = bundle.gdf_metric.crs.to_string()
+    for factor in manifest.get("factors", []):
+        if "lattice" in factor:
+            factor["lattice"] = lattice
+        if factor.get("clip_bounds") is not None:
+            factor["clip_bounds"] = buffered_bounds(aoi_bounds, aoi_crs, float(factor["max_distance_m"]), factor["crs"])
     save_manifest(state, manifest)
     return grid_path
 
 
-def load_grid(state: ProjectState) -> gpd.GeoDataFrame:
+def load_grid(state: ProjectState) -> LatticeGrid:
     manifest = load_manifest(state)
     grid_path = manifest.get("grid_path")
     if not isinstance(grid_path, str):
         raise ValueError("Grid not found. Run: antevorta build-grid --resolution <meters>")
-    grid = gpd.read_file(grid_path)
-    if grid.empty:
+    if Path(grid_path).suffix != ".npz":
+        raise ValueError("Grid uses an outdated format. Run: antevorta build-grid --resolution <meters>")
+    grid = LatticeGrid.load(Path(grid_path))
+    if len(grid) == 0:
         raise ValueError("Grid is empty")
-    return require_wgs84(grid, "Grid")
+    return grid
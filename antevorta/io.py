@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import shutil
 from pathlib import Path
@@ -9,6 +10,7 @@ import pandas as pd
 
 
 ALLOWED_FACTOR_EXTENSIONS = {".geojson", ".shp", ".tif", ".tiff"}
+PARQUET_ROW_GROUP_SIZE = 65_536
 
 
 def ensure_dir(path: Path) -> None:
@@ -34,6 +36,17 @@ def copy_file(src: Path, dst: Path) -> Path:
     return dst
 
 
+def file_digest(paths: list[Path], chunk_size: int = 1 << 20) -> str:
+    """SHA-256 over the suffixes and contents of ``paths``, independent of file stems."""
+    digest = hashlib.sha256()
+    for path in sorted(paths, key=lambda p: p.suffix.lower()):
+        digest.update(path.suffix.lower().encode("utf-8"))
+        with path.open("rb") as f:
+            while chunk := f.read(chunk_size):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
 def read_events_csv(path: Path) -> pd.DataFrame:
     return pd.read_csv(path)
 
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import geopandas as gpd
+import pandas as pd
+from pyproj import CRS
+
+from antevorta.config import CONFIG
+from antevorta.events import load_events_geodataframe
+from antevorta.factors import load_factors, preload_event_trees, preload_factor_source, reserve_factor_caches
+from antevorta.grid import load_grid
+from antevorta.model import is_event_history_factor
+from antevorta.project import ProjectState, load_manifest
+from antevorta.spatial import LatticeGrid, as_metric
+from antevorta.temporal import select_events
+
+
+def run_concurrently(tasks: list[Callable[[], Any]], max_workers: int = CONFIG.io_workers) -> list[Any]:
+    """Run independent I/O-bound tasks in a bounded thread pool.
+
+    Results come back in task order. Every task runs to completion; if any fail,
+    the exception of the first failing task in task order is raised, regardless of
+    which finished first.
+    """
+    if max_workers <= 0:
+        raise ValueError("max_workers must be > 0")
+    if not tasks:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as pool:
+        futures = [pool.submit(task) for task in tasks]
+
+    for future in futures:
+        exc = future.exception()
+        if exc is not None:
+            raise exc
+    return [future.result() for future in futures]
+
+
+def load_assessment_inputs(
+    state: ProjectState,
+    max_workers: int = CONFIG.io_workers,
+    since: pd.Timestamp | None = None,
+    until: pd.Timestamp | None = None,
+) -> tuple[gpd.GeoDataFrame, LatticeGrid, list[dict[str, Any]]]:
+    """Load events, grid and everything scoring a project's factors reads, in parallel.
+
+    Events are narrowed to ``since <= timestamp < until`` before the event-density
+    KD-trees are built from them, in the CRSs that events and grid are scored in.
+    """
+    manifest = load_manifest(state)
+    events_path = manifest.get("events_path")
+    if not isinstance(events_path, str):
+        raise ValueError("Events missing. Run: antevorta add-events <events-file>")
+    factors = load_factors(state)
+    lattice = manifest.get("grid_lattice")
+    grid_crs = CRS.from_user_input(lattice["crs"]) if isinstance(lattice, dict) else None
+    reserve_factor_caches(len(factors))
+    history = any(is_event_history_factor(factor) for factor in factors)
+
+    def load_events() -> gpd.GeoDataFrame:
+        events = select_events(load_events_geodataframe(Path(events_path)), since, until)
+        if history:
+            crs_list = [as_metric(events).gdf_metric.crs] + ([grid_crs] if grid_crs is not None else [])
+            preload_event_trees(events, crs_list)
+        return events
+
+    tasks: list[Callable[[], Any]] = [load_events, partial(load_grid, state)]
+    tasks.extend(partial(preload_factor_source, factor, grid_crs) for factor in factors)
+    events, grid, *_ = run_concurrently(tasks, max_workers)
+    return events, grid, factors
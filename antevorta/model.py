@@ -5,11 +5,17 @@ from dataclasses import dataclass
 import geopandas as gpd
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.preprocessing import StandardScaler
 
 from antevorta.config import CONFIG
+from antevorta.estimators import EstimatorConfig, LogisticTrainer, fit_scaler
 from antevorta.factors import score_points_for_factor
-from antevorta.spatial import as_metric, random_points_from_grid
+from antevorta.spatial import LatticeGrid, as_metric
+
+
+# Grid cells whose point geometries are built at once while scoring factors.
+GRID_SCORE_CELLS = 250_000
 
 
 @dataclass
@@ -20,41 +26,119 @@ class TrainingData:
 
 @dataclass
 class FittedModel:
-    estimator: LogisticRegression
+    estimator: LogisticRegression | SGDClassifier
     feature_names: list[str]
+    scaler: StandardScaler | None = None
+
+    def predict_proba(self, x: pd.DataFrame | np.ndarray) -> np.ndarray:
+        if isinstance(x, pd.DataFrame):
+            features = x[self.feature_names].to_numpy(dtype=float)
+        else:
+            features = np.asarray(x, dtype=float)
+        if self.scaler is not None:
+            features = self.scaler.transform(features)
+        return self.estimator.predict_proba(features)[:, 1]
+
+
+def _build_grid_features(
+    grid: LatticeGrid,
+    factors: list[dict[str, object]],
+    events: gpd.GeoDataFrame | None = None,
+) -> pd.DataFrame:
+    # Cell geometries exist only for the block being scored, already in the grid's metric CRS.
+    blocks: list[pd.DataFrame] = []
+    for start in range(0, len(grid), GRID_SCORE_CELLS):
+        cells = slice(start, start + GRID_SCORE_CELLS)
+        points_wgs84 = grid.to_geodataframe(cells)
+        metric_points = grid.metric_points(cells)
+        blocks.append(
+            pd.DataFrame(
+                {
+                    str(factor["name"]): score_points_for_factor(points_wgs84, metric_points, factor, events=events)
+                    for factor in factors
+                },
+                index=pd.RangeIndex(len(points_wgs84)),
+            )
+        )
+    return pd.concat(blocks, ignore_index=True)
 
 
 def build_feature_matrix(
-    points_wgs84: gpd.GeoDataFrame,
+    points_wgs84: gpd.GeoDataFrame | LatticeGrid,
     factors: list[dict[str, object]],
+    exclude_self: bool = False,
+    events: gpd.GeoDataFrame | None = None,
 ) -> pd.DataFrame:
+    """Score points for every factor, one column per factor name.
+
+    ``events`` are the events event-density factors count, for example only those
+    in an ``--since/--until`` window; by default each factor's events file.
+    """
+    if isinstance(points_wgs84, LatticeGrid):
+        return _build_grid_features(points_wgs84, factors, events)
     metric_points = as_metric(points_wgs84).gdf_metric
     data: dict[str, np.ndarray] = {}
     for factor in factors:
         name = str(factor["name"])
-        data[name] = score_points_for_factor(points_wgs84, metric_points, factor)
-    return pd.DataFrame(data)
+        data[name] = score_points_for_factor(
+            points_wgs84,
+            metric_points,
+            factor,
+            exclude_self=exclude_self,
+            events=events,
+        )
+    return pd.DataFrame(data, index=pd.RangeIndex(len(points_wgs84)))
 
 
-def build_training_data(
-    events_wgs84: gpd.GeoDataFrame,
-    grid_wgs84: gpd.GeoDataFrame,
+def is_event_history_factor(factor: dict[str, object]) -> bool:
+    """Whether a factor's score depends on which events have happened."""
+    return str(factor["source"]) == "events"
+
+
+@dataclass
+class EventHistoryFeatures:
+    """Event-history factors rescored against only the events before a validation window.
+
+    Called with the positions of those past events, it returns the factor columns for
+    every event and background point. Past events are scored excluding themselves.
+    """
+
+    events: gpd.GeoDataFrame
+    background: gpd.GeoDataFrame
+    factors: list[dict[str, object]]
+
+    def __call__(self, past_pos: np.ndarray) -> tuple[pd.DataFrame, pd.DataFrame]:
+        names = [str(factor["name"]) for factor in self.factors]
+        is_past = np.zeros(len(self.events), dtype=bool)
+        is_past[past_pos] = True
+        past = self.events.iloc[np.flatnonzero(is_past)]
+
+        event_x = pd.DataFrame(0.0, index=pd.RangeIndex(len(self.events)), columns=names)
+        for rows, exclude_self in ((is_past, True), (~is_past, False)):
+            if rows.any():
+                scored = build_feature_matrix(self.events.iloc[np.flatnonzero(rows)], self.factors, exclude_self, past)
+                event_x.loc[rows, names] = scored[names].to_numpy()
+        background_x = build_feature_matrix(self.background, self.factors, events=past)
+        return event_x, background_x
+
+
+def background_points(grid: LatticeGrid, n_points: int, seed: int = CONFIG.seed) -> gpd.GeoDataFrame:
+    if len(grid) == 0:
+        raise ValueError("No grid cells found")
+    return grid.to_geodataframe(grid.sample(n_points, seed))[["geometry"]]
+
+
+def build_background_features(
+    grid: LatticeGrid,
     factors: list[dict[str, object]],
+    n_points: int,
     seed: int = CONFIG.seed,
-    background_multiplier: int = CONFIG.background_multiplier,
-) -> TrainingData:
-    if len(events_wgs84) == 0:
-        raise ValueError("No events found")
-    if len(grid_wgs84) == 0:
-        raise ValueError("No grid cells found")
+    events: gpd.GeoDataFrame | None = None,
+) -> pd.DataFrame:
+    return build_feature_matrix(background_points(grid, n_points, seed), factors, events=events)
 
-    event_x = build_feature_matrix(events_wgs84, factors)
-    n_background = max(1, len(events_wgs84) * background_multiplier)
-    grid_metric = as_metric(grid_wgs84).gdf_metric
-    background_metric = random_points_from_grid(grid_metric, n_background, seed)
-    background_wgs84 = background_metric.to_crs(epsg=4326)
-    background_x = build_feature_matrix(background_wgs84, factors)
 
+def stack_training_data(event_x: pd.DataFrame, background_x: pd.DataFrame) -> TrainingData:
     x = pd.concat([event_x, background_x], axis=0, ignore_index=True)
     y = pd.Series(
         np.concatenate(
@@ -65,26 +149,52 @@ def build_training_data(
     return TrainingData(x=x, y=y)
 
 
-def train_logistic_regression(data: TrainingData, seed: int = CONFIG.seed) -> FittedModel:
+def build_training_data(
+    events_wgs84: gpd.GeoDataFrame,
+    grid: LatticeGrid,
+    factors: list[dict[str, object]],
+    seed: int = CONFIG.seed,
+    background_multiplier: int = CONFIG.background_multiplier,
+) -> TrainingData:
+    if len(events_wgs84) == 0:
+        raise ValueError("No events found")
+    if len(grid) == 0:
+        raise ValueError("No grid cells found")
+
+    # Event-density factors count the training events themselves, not the whole events file.
+    event_x = build_feature_matrix(events_wgs84, factors, exclude_self=True, events=events_wgs84)
+    n_background = max(1, len(events_wgs84) * background_multiplier)
+    background_x = build_background_features(grid, factors, n_background, seed, events=events_wgs84)
+    return stack_training_data(event_x, background_x)
+
+
+def train_logistic_regression(
+    data: TrainingData,
+    seed: int = CONFIG.seed,
+    config: EstimatorConfig | None = None,
+) -> FittedModel:
     if data.y.nunique() < 2:
         raise ValueError("Training labels must include both event and background classes")
 
-    estimator = LogisticRegression(
-        solver="lbfgs",
-        random_state=seed,
-        max_iter=1000,
-    )
-    estimator.fit(data.x, data.y)
-    return FittedModel(estimator=estimator, feature_names=list(data.x.columns))
+    config = config or EstimatorConfig(seed=seed)
+    x = data.x.to_numpy(dtype=float)
+    scaler = fit_scaler(x) if config.standardize else None
+    if scaler is not None:
+        x = scaler.transform(x)
+    estimator = LogisticTrainer(config).fit(x, data.y.to_numpy())
+    return FittedModel(estimator=estimator, feature_names=list(data.x.columns), scaler=scaler)
 
 
 def predict_likelihood(
     model: FittedModel,
-    grid_wgs84: gpd.GeoDataFrame,
+    grid: LatticeGrid,
     factors: list[dict[str, object]],
+    features: pd.DataFrame | None = None,
+    events: gpd.GeoDataFrame | None = None,
 ) -> pd.DataFrame:
-    features = build_feature_matrix(grid_wgs84, factors)
-    proba = model.estimator.predict_proba(features)[:, 1]
+    if features is None:
+        features = build_feature_matrix(grid, factors, events=events)
+    proba = model.predict_proba(features)
 
     p_min = float(np.min(proba))
     p_max = float(np.max(proba))
@@ -93,11 +203,12 @@ def predict_likelihood(
     else:
         normalized = np.zeros_like(proba)
 
+    longitude, latitude = grid.lonlat()
     out = pd.DataFrame(
         {
-            "cell_id": grid_wgs84["cell_id"].astype(int).to_numpy(),
-            "latitude": grid_wgs84.geometry.y.to_numpy(),
-            "longitude": grid_wgs84.geometry.x.to_numpy(),
+            "cell_id": grid.cell_ids,
+            "latitude": latitude,
+            "longitude": longitude,
             "probability": proba,
             "likelihood": normalized,
         }
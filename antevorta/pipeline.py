@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import asdict
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+import geopandas as gpd
+import joblib
+import numpy as np
+import pandas as pd
+
+from antevorta.config import CONFIG
+from antevorta.estimators import EstimatorConfig
+from antevorta.events import load_events_geodataframe
+from antevorta.export import export_assessment
+from antevorta.factors import factor_fingerprint, load_factors
+from antevorta.grid import load_grid
+from antevorta.io import ensure_dir, file_digest
+from antevorta.model import (
+    FittedModel,
+    build_background_features,
+    build_feature_matrix,
+    factor_weights,
+    predict_likelihood,
+    stack_training_data,
+    train_logistic_regression,
+)
+from antevorta.project import ProjectState, load_manifest, save_manifest
+from antevorta.spatial import LatticeGrid
+
+
+def _stage_key(*parts: object) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _file_stamp(path: Path) -> list[int]:
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class Pipeline:
+    """Make-style assessment pipeline whose stage records live in the project manifest.
+
+    Stages are events, grid, one feature column per factor, model and exports. Each
+    stage records a key hashed from its inputs plus the outputs it wrote; ``run``
+    re-executes a stage only when that key changed or an output is missing, and
+    loads events and grid only when a stale stage needs them.
+    """
+
+    def __init__(
+        self,
+        state: ProjectState,
+        output_dir: Path,
+        config: EstimatorConfig | None = None,
+        seed: int = CONFIG.seed,
+        background_multiplier: int = CONFIG.background_multiplier,
+        output_format: str = "geojson",
+    ) -> None:
+        self.state = state
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.config = config or EstimatorConfig(seed=seed)
+        self.seed = seed
+        self.background_multiplier = background_multiplier
+        self.cache_dir = state.root / "cache"
+        self.manifest = load_manifest(state)
+        self.factors = load_factors(state)
+        self.status: dict[str, str] = {}
+
+    @property
+    def _records(self) -> dict[str, Any]:
+        records = self.manifest.setdefault("pipeline", {})
+        if not isinstance(records, dict):
+            raise ValueError("Invalid project manifest: pipeline must be an object")
+        return records
+
+    def _manifest_path(self, key: str, missing: str) -> Path:
+        value = self.manifest.get(key)
+        if not isinstance(value, str):
+            raise ValueError(missing)
+        return Path(value)
+
+    @cached_property
+    def events(self) -> gpd.GeoDataFrame:
+        return load_events_geodataframe(self._events_path)
+
+    @cached_property
+    def grid(self) -> LatticeGrid:
+        return load_grid(self.state)
+
+    @cached_property
+    def _events_path(self) -> Path:
+        return self._manifest_path("events_path", "Events missing. Run: antevorta add-events <events-file>")
+
+    @cached_property
+    def _grid_path(self) -> Path:
+        return self._manifest_path("grid_path", "Grid not found. Run: antevorta build-grid --resolution <meters>")
+
+    def _is_current(self, stage: str, key: str, force: bool) -> bool:
+        record = self._records.get(stage)
+        if force or not isinstance(record, dict) or record.get("key") != key:
+            return False
+        outputs = record.get("outputs", {})
+        return all(Path(path).exists() and _file_stamp(Path(path)) == stamp for path, stamp in outputs.items())
+
+    def _record(self, stage: str, key: str, outputs: list[Path] | None = None) -> None:
+        self._records[stage] = {
+            "key": key,
+            "outputs": {str(path.resolve()): _file_stamp(path) for path in outputs or []},
+        }
+        save_manifest(self.state, self.manifest)
+
+    def _run_stage(
+        self,
+        stage: str,
+        key: str,
+        force: bool,
+        execute: Callable[[], list[Path] | None],
+    ) -> None:
+        if self._is_current(stage, key, force):
+            self.status[stage] = "up-to-date"
+            logging.info("Stage %s is up to date", stage)
+            return
+        self._record(stage, key, execute())
+        self.status[stage] = "ran"
+        logging.info("Stage %s ran", stage)
+
+    def _column_path(self, name: str) -> Path:
+        return self.cache_dir / "features" / f"{name}.npz"
+
+    def _build_column(self, factor: dict[str, Any]) -> list[Path]:
+        event_x = build_feature_matrix(self.events, [factor], exclude_self=True, events=self.events)
+        n_background = max(1, len(self.events) * self.background_multiplier)
+        background_x = build_background_features(self.grid, [factor], n_background, self.seed, events=self.events)
+        grid_x = build_feature_matrix(self.grid, [factor], events=self.events)
+
+        name = str(factor["name"])
+        path = self._column_path(name)
+        ensure_dir(path.parent)
+        with path.open("wb") as f:
+            np.savez(
+                f,
+                events=event_x[name].to_numpy(),
+                background=background_x[name].to_numpy(),
+                grid=grid_x[name].to_numpy(),
+            )
+        return [path]
+
+    def _load_columns(self) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        columns: dict[str, dict[str, np.ndarray]] = {"events": {}, "background": {}, "grid": {}}
+        for factor in self.factors:
+            name = str(factor["name"])
+            with np.load(self._column_path(name)) as stored:
+                for part in columns:
+                    columns[part][name] = stored[part]
+        return (
+            pd.DataFrame(columns["events"]),
+            pd.DataFrame(columns["background"]),
+            pd.DataFrame(columns["grid"]),
+        )
+
+    def _train(self) -> list[Path]:
+        event_x, background_x, _ = self._load_columns()
+        fitted = train_logistic_regression(stack_training_data(event_x, background_x), config=self.config)
+        path = self.cache_dir / "model.joblib"
+        ensure_dir(path.parent)
+        joblib.dump(fitted, path)
+        return [path]
+
+    def _export(self) -> list[Path]:
+        fitted: FittedModel = joblib.load(self.cache_dir / "model.joblib")
+        _, _, grid_x = self._load_columns()
+        ranked = predict_likelihood(fitted, self.grid, self.factors, features=grid_x)
+        outputs = export_assessment(ranked, factor_weights(fitted), self.output_dir, fmt=self.output_format)
+        return list(outputs.values())
+
+    def run(self, force: bool = False) -> dict[str, str]:
+        events_key = _stage_key("events", file_digest([self._events_path]))
+        grid_key = _stage_key("grid", file_digest([self._grid_path]))
+        self._run_stage("events", events_key, force, lambda: None)
+        self._run_stage("grid", grid_key, force, lambda: None)
+
+        column_keys: list[str] = []
+        for factor in self.factors:
+            key = _stage_key(
+                "factor",
+                events_key,
+                grid_key,
+                factor_fingerprint(factor),
+                self.seed,
+                self.background_multiplier,
+            )
+            self._run_stage(f"factor:{factor['name']}", key, force, lambda factor=factor: self._build_column(factor))
+            column_keys.append(key)
+
+        model_key = _stage_key("model", column_keys, asdict(self.config))
+        self._run_stage("model", model_key, force, self._train)
+        exports_key = _stage_key("exports", model_key, str(self.output_dir.resolve()), self.output_format)
+        self._run_stage("exports", exports_key, force, self._export)
+
+        stale = [stage for stage in self._records if stage.startswith("factor:") and stage not in self.status]
+        for stage in stale:
+            del self._records[stage]
+        if stale:
+            save_manifest(self.state, self.manifest)
+        return self.status
@@ -16,7 +16,14 @@ class ProjectState:
 
     @classmethod
     def from_cwd(cls) -> "ProjectState":
-        root = CONFIG.project_dir
+        return cls.from_root(CONFIG.project_dir)
+
+    @classmethod
+    def from_dir(cls, directory: Path) -> "ProjectState":
+        return cls.from_root(directory / CONFIG.project_dir_name)
+
+    @classmethod
+    def from_root(cls, root: Path) -> "ProjectState":
         return cls(
             root=root,
             data_dir=root / "data",
@@ -31,8 +38,8 @@ class ProjectState:
             )
 
 
-def initialize_project(aoi_path: Path) -> ProjectState:
-    state = ProjectState.from_cwd()
+def initialize_project(aoi_path: Path, state: ProjectState | None = None) -> ProjectState:
+    state = state or ProjectState.from_cwd()
     ensure_dir(state.root)
     ensure_dir(state.data_dir)
     ensure_dir(state.factors_dir)
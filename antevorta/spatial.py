@@ -1,10 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from pathlib import Path
 
 import geopandas as gpd
 import numpy as np
-from shapely.geometry import Point, Polygon
+import shapely
+from pyproj import Transformer
+from shapely.geometry import Polygon
+
+
+# Upper bound on cell centres tested against the AOI at once while building a grid.
+GRID_BLOCK_CELLS = 1_000_000
 
 
 @dataclass(frozen=True)
@@ -13,6 +22,64 @@ class SpatialBundle:
     gdf_metric: gpd.GeoDataFrame
 
 
+@dataclass(frozen=True)
+class GridLattice:
+    """Regular lattice of square cells in a metric CRS.
+
+    Cell ``(ix, iy)`` spans ``origin + (ix, iy) * resolution_m`` to one resolution
+    beyond it; flat indices run x-major (``ix * ny + iy``) like ``make_grid``.
+    """
+
+    crs: str
+    origin_x: float
+    origin_y: float
+    resolution_m: float
+    nx: int
+    ny: int
+
+    @classmethod
+    def from_bounds(
+        cls,
+        bounds: tuple[float, float, float, float],
+        resolution_m: float,
+        crs: str,
+    ) -> "GridLattice":
+        minx, miny, maxx, maxy = (float(v) for v in bounds)
+        return cls(
+            crs=crs,
+            origin_x=minx,
+            origin_y=miny,
+            resolution_m=float(resolution_m),
+            nx=len(np.arange(minx, maxx, resolution_m)),
+            ny=len(np.arange(miny, maxy, resolution_m)),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, object]) -> "GridLattice":
+        return cls(
+            crs=str(data["crs"]),
+            origin_x=float(data["origin_x"]),
+            origin_y=float(data["origin_y"]),
+            resolution_m=float(data["resolution_m"]),
+            nx=int(data["nx"]),
+            ny=int(data["ny"]),
+        )
+
+    def to_dict(self) -> dict[str, object]:
+        return asdict(self)
+
+    @property
+    def size(self) -> int:
+        return self.nx * self.ny
+
+    def flat_index(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Flat lattice index of the cell containing each coordinate, or -1 outside."""
+        ix = np.floor((np.asarray(x, dtype=float) - self.origin_x) / self.resolution_m)
+        iy = np.floor((np.asarray(y, dtype=float) - self.origin_y) / self.resolution_m)
+        inside = (ix >= 0) & (ix < self.nx) & (iy >= 0) & (iy < self.ny)
+        return np.where(inside, ix * self.ny + iy, -1).astype(np.int64)
+
+
 def require_wgs84(gdf: gpd.GeoDataFrame, name: str) -> gpd.GeoDataFrame:
     if gdf.crs is None:
         raise ValueError(f"{name} has no CRS; expected EPSG:4326 data")
@@ -26,39 +93,113 @@ def as_metric(gdf_wgs84: gpd.GeoDataFrame) -> SpatialBundle:
     return SpatialBundle(gdf_wgs84=gdf_wgs84, gdf_metric=gdf_wgs84.to_crs(metric_crs))
 
 
-def make_grid(aoi_metric: gpd.GeoDataFrame, resolution_m: float) -> gpd.GeoDataFrame:
-    polygon = aoi_metric.geometry.iloc[0]
-    if not isinstance(polygon, Polygon):
-        raise ValueError("AOI must contain a polygon geometry")
-
-    minx, miny, maxx, maxy = polygon.bounds
-    xs = np.arange(minx, maxx, resolution_m)
-    ys = np.arange(miny, maxy, resolution_m)
-    cells: list[dict[str, object]] = []
-    cell_id = 1
-
-    for x in xs:
-        for y in ys:
-            center = Point(x + resolution_m / 2.0, y + resolution_m / 2.0)
-            if polygon.contains(center):
-                cells.append({"cell_id": cell_id, "geometry": center})
-                cell_id += 1
-
-    if not cells:
-        raise ValueError("Grid generation produced no cells; adjust AOI or resolution")
-    return gpd.GeoDataFrame(cells, geometry="geometry", crs=aoi_metric.crs)
-
-
-def random_points_from_grid(
-    grid_metric: gpd.GeoDataFrame,
-    n_points: int,
-    seed: int,
-) -> gpd.GeoDataFrame:
-    if n_points <= 0:
-        raise ValueError("n_points must be > 0")
-    if len(grid_metric) == 0:
-        raise ValueError("Grid has no cells")
-
-    sample_size = min(n_points, len(grid_metric))
-    sampled = grid_metric.sample(n=sample_size, replace=False, random_state=seed)
-    return sampled[["geometry"]].copy()
+def buffered_bounds(
+    bounds: tuple[float, float, float, float] | np.ndarray,
+    crs: str,
+    margin_m: float,
+    target_crs: str,
+) -> list[float]:
+    """``bounds`` in metric ``crs`` grown by ``margin_m``, as a box in ``target_crs``."""
+    minx, miny, maxx, maxy = (float(v) for v in bounds)
+    return list(
+        Transformer.from_crs(crs, target_crs, always_xy=True).transform_bounds(
+            minx - margin_m,
+            miny - margin_m,
+            maxx + margin_m,
+            maxy + margin_m,
+            densify_pts=21,
+        )
+    )
+
+
+def grid_lattice(aoi_metric: gpd.GeoDataFrame, resolution_m: float) -> GridLattice:
+    return GridLattice.from_bounds(aoi_metric.geometry.iloc[0].bounds, resolution_m, aoi_metric.crs.to_string())
+
+
+@dataclass(frozen=True, eq=False)
+class LatticeGrid:
+    """Grid cells stored as a lattice plus a membership mask instead of Point geometries.
+
+    ``mask`` flags, in flat lattice order, the cells whose centre lies inside the AOI.
+    Member cells are numbered ``cell_id`` 1.. in that order; coordinates are derived
+    on demand and geometries built only for the cells asked for.
+    """
+
+    lattice: GridLattice
+    mask: np.ndarray
+
+    @classmethod
+    def from_aoi(cls, aoi_metric: gpd.GeoDataFrame, resolution_m: float) -> "LatticeGrid":
+        polygon = aoi_metric.geometry.iloc[0]
+        if not isinstance(polygon, Polygon):
+            raise ValueError("AOI must contain a polygon geometry")
+
+        lattice = grid_lattice(aoi_metric, resolution_m)
+        shapely.prepare(polygon)
+        ys = lattice.origin_y + np.arange(lattice.ny) * lattice.resolution_m + lattice.resolution_m / 2.0
+        mask = np.zeros(lattice.size, dtype=bool)
+        step = max(1, GRID_BLOCK_CELLS // max(1, lattice.ny))
+        for start in range(0, lattice.nx, step):
+            ix = np.arange(start, min(start + step, lattice.nx))
+            xs = lattice.origin_x + ix * lattice.resolution_m + lattice.resolution_m / 2.0
+            x, y = np.meshgrid(xs, ys, indexing="ij")
+            mask[start * lattice.ny : (start + len(ix)) * lattice.ny] = shapely.contains_xy(polygon, x.ravel(), y.ravel())
+
+        if not mask.any():
+            raise ValueError("Grid generation produced no cells; adjust AOI or resolution")
+        return cls(lattice=lattice, mask=mask)
+
+    @classmethod
+    def load(cls, path: Path) -> "LatticeGrid":
+        with np.load(path) as stored:
+            lattice = GridLattice.from_dict(json.loads(str(stored["lattice"])))
+            mask = np.unpackbits(stored["mask"], count=lattice.size).astype(bool)
+        return cls(lattice=lattice, mask=mask)
+
+    def save(self, path: Path) -> None:
+        with path.open("wb") as f:
+            np.savez(f, lattice=json.dumps(self.lattice.to_dict()), mask=np.packbits(self.mask))
+
+    def __len__(self) -> int:
+        return len(self.flat_indices)
+
+    @cached_property
+    def flat_indices(self) -> np.ndarray:
+        return np.flatnonzero(self.mask)
+
+    @property
+    def cell_ids(self) -> np.ndarray:
+        return np.arange(1, len(self) + 1, dtype=np.int64)
+
+    def metric_xy(self, cells: slice | np.ndarray = slice(None)) -> tuple[np.ndarray, np.ndarray]:
+        """Cell centres in the lattice CRS for the member cells selected by position."""
+        ix, iy = np.divmod(self.flat_indices[cells], self.lattice.ny)
+        half = self.lattice.resolution_m / 2.0
+        x = self.lattice.origin_x + ix * self.lattice.resolution_m + half
+        y = self.lattice.origin_y + iy * self.lattice.resolution_m + half
+        return x, y
+
+    def lonlat(self, cells: slice | np.ndarray = slice(None)) -> tuple[np.ndarray, np.ndarray]:
+        transformer = Transformer.from_crs(self.lattice.crs, "EPSG:4326", always_xy=True)
+        return transformer.transform(*self.metric_xy(cells))
+
+    def metric_points(self, cells: slice | np.ndarray = slice(None)) -> gpd.GeoDataFrame:
+        x, y = self.metric_xy(cells)
+        return gpd.GeoDataFrame(geometry=gpd.points_from_xy(x, y), crs=self.lattice.crs)
+
+    def to_geodataframe(self, cells: slice | np.ndarray = slice(None)) -> gpd.GeoDataFrame:
+        """WGS84 centre points with ``cell_id``, ``latitude`` and ``longitude`` columns."""
+        longitude, latitude = self.lonlat(cells)
+        return gpd.GeoDataFrame(
+            {"cell_id": self.cell_ids[cells], "latitude": latitude, "longitude": longitude},
+            geometry=gpd.points_from_xy(longitude, latitude),
+            crs="EPSG:4326",
+        )
+
+    def sample(self, n_points: int, seed: int) -> np.ndarray:
+        """Positions of up to ``n_points`` distinct member cells, drawn reproducibly."""
+        if n_points <= 0:
+            raise ValueError("n_points must be > 0")
+        if len(self) == 0:
+            raise ValueError("Grid has no cells")
+        return np.random.RandomState(seed).choice(len(self), size=min(n_points, len(self)), replace=False)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+def parse_time_bound(value: str | None) -> pd.Timestamp | None:
+    if value is None:
+        return None
+    try:
+        return pd.to_datetime(value, utc=True)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid time bound: {value}") from exc
+
+
+@dataclass(frozen=True)
+class TimeIndex:
+    """Event positions sorted once by timestamp; windows are found by binary search.
+
+    ``order`` holds positions into the original events frame and ``times`` the matching
+    UTC timestamps as int64 nanoseconds, both in ascending time order.
+    """
+
+    order: np.ndarray
+    times: np.ndarray
+
+    @classmethod
+    def from_timestamps(cls, timestamps: pd.Series) -> "TimeIndex":
+        values = pd.to_datetime(timestamps, utc=True).to_numpy(dtype="datetime64[ns]").view(np.int64)
+        order = np.argsort(values, kind="stable")
+        return cls(order=order, times=values[order])
+
+    def bounds(self, since: pd.Timestamp | None = None, until: pd.Timestamp | None = None) -> tuple[int, int]:
+        start = 0 if since is None else int(np.searchsorted(self.times, since.value, side="left"))
+        stop = len(self.times) if until is None else int(np.searchsorted(self.times, until.value, side="left"))
+        return start, max(start, stop)
+
+    def window(self, since: pd.Timestamp | None = None, until: pd.Timestamp | None = None) -> np.ndarray:
+        """Positions of events with ``since <= timestamp < until``, in time order."""
+        start, stop = self.bounds(since, until)
+        return self.order[start:stop]
+
+    def rolling_origin(self, windows: int) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Split the event time span into equal-duration windows.
+
+        Returns one ``(train, test)`` pair per origin: every event before the window
+        trains the model and the events inside the window score it. Origins whose
+        window holds no events are skipped.
+        """
+        if windows < 2:
+            raise ValueError("Temporal validation requires at least 2 windows")
+        if len(self.times) == 0:
+            raise ValueError("No events found")
+
+        edges = np.linspace(self.times[0], self.times[-1], windows + 1)
+        cuts = np.searchsorted(self.times, edges[1:-1], side="left")
+        cuts = np.concatenate([[0], cuts, [len(self.times)]])
+
+        splits: list[tuple[np.ndarray, np.ndarray]] = []
+        for k in range(1, windows):
+            start, stop = int(cuts[k]), int(cuts[k + 1])
+            if start == 0 or stop == start:
+                continue
+            splits.append((self.order[:start], self.order[start:stop]))
+        return splits
+
+
+def select_events(
+    events: pd.DataFrame,
+    since: pd.Timestamp | None = None,
+    until: pd.Timestamp | None = None,
+) -> pd.DataFrame:
+    if since is None and until is None:
+        return events
+    selected = events.iloc[TimeIndex.from_timestamps(events["timestamp"]).window(since, until)]
+    if len(selected) == 0:
+        raise ValueError("No events found in the requested time window")
+    return selected.reset_index(drop=True)
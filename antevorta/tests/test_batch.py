@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import geopandas as gpd
+import pandas as pd
+from shapely.geometry import LineString, Point, Polygon
+
+from antevorta.batch import load_template, plan_batch, run_batch
+from antevorta.events import add_events
+from antevorta.factors import add_factor, load_factors
+from antevorta.grid import build_grid, load_grid
+from antevorta.model import build_feature_matrix
+from antevorta.project import ProjectState, initialize_project
+
+
+def _write_aoi(path, offset):
+    aoi = gpd.GeoDataFrame(
+        [
+            {
+                "geometry": Polygon(
+                    [
+                        (offset - 0.03, -0.03),
+                        (offset - 0.03, 0.03),
+                        (offset + 0.03, 0.03),
+                        (offset + 0.03, -0.03),
+                    ]
+                )
+            }
+        ],
+        crs="EPSG:4326",
+    )
+    aoi.to_file(path, driver="GeoJSON")
+    return path
+
+
+def test_batch_assesses_aois_from_template(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    events_path = tmp_path / "events.csv"
+    pd.DataFrame(
+        {
+            "id": ["e1", "e2", "e3", "e4"],
+            "latitude": [0.001, 0.002, -0.001, -0.002],
+            "longitude": [0.001, -0.001, 0.052, 0.048],
+            "timestamp": ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"],
+        }
+    ).to_csv(events_path, index=False)
+    factor_path = tmp_path / "roads.geojson"
+    gpd.GeoDataFrame([{"geometry": Point(0.0, 0.0)}, {"geometry": Point(0.05, 0.0)}], crs="EPSG:4326").to_file(
+        factor_path, driver="GeoJSON"
+    )
+
+    initialize_project(_write_aoi(tmp_path / "template_aoi.geojson", 0.0))
+    state = ProjectState.from_cwd()
+    add_events(state, events_path)
+    first = add_factor(state, factor_path, "distance")
+    again = add_factor(state, factor_path, "distance")
+    build_grid(state, resolution_m=1000)
+
+    assert first["path"] == again["path"]
+    assert len(list(state.factors_dir.iterdir())) == 1
+
+    aois = [_write_aoi(tmp_path / "west.geojson", 0.0), _write_aoi(tmp_path / "east.geojson", 0.05)]
+    template = load_template(tmp_path)
+    targets = plan_batch(aois, tmp_path / "runs", template)
+    outputs = run_batch(targets, template, jobs=2)
+
+    assert [o["ranked_grid"].parent.name for o in outputs] == ["west", "east"]
+    stored = [pd.read_csv(target.state.data_dir / "events.csv") for target in targets]
+    assert [events["id"].tolist() for events in stored] == [["e1", "e2"], ["e3", "e4"]]
+    for output in outputs:
+        ranked = pd.read_csv(output["ranked_grid"])
+        assert ranked["likelihood"].between(0.0, 1.0).all()
+
+
+def test_batch_reclips_vector_factors_for_distant_aois(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    events_path = tmp_path / "events.csv"
+    pd.DataFrame(
+        {
+            "id": ["e1", "e2", "e3", "e4"],
+            "latitude": [0.001, -0.002, 0.002, -0.001],
+            "longitude": [0.001, -0.001, 0.201, 0.199],
+            "timestamp": ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"],
+        }
+    ).to_csv(events_path, index=False)
+    roads_path = tmp_path / "roads.geojson"
+    gpd.GeoDataFrame(
+        [{"geometry": LineString([(0.0, -0.1), (0.0, 0.1)])}, {"geometry": LineString([(0.2, -0.1), (0.2, 0.1)])}],
+        crs="EPSG:4326",
+    ).to_file(roads_path, driver="GeoJSON")
+
+    initialize_project(_write_aoi(tmp_path / "template_aoi.geojson", 0.0))
+    state = ProjectState.from_cwd()
+    add_events(state, events_path)
+    add_factor(state, roads_path, "distance", max_distance_m=1000.0)
+    build_grid(state, resolution_m=500)
+
+    template = load_template(tmp_path)
+    targets = plan_batch([_write_aoi(tmp_path / "far.geojson", 0.2)], tmp_path / "runs", template)
+    (output,) = run_batch(targets, template)
+
+    assert pd.read_csv(output["ranked_grid"])["likelihood"].between(0.0, 1.0).all()
+    features = build_feature_matrix(load_grid(targets[0].state), load_factors(targets[0].state))
+    assert features["roads"].min() < 500.0
+    assert features["roads"].max() == 1000.0
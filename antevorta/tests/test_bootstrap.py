@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from antevorta.bootstrap import bootstrap_assessment
+from antevorta.model import TrainingData
+
+
+def test_bootstrap_summaries_are_deterministic_across_jobs():
+    rng = np.random.default_rng(1)
+    y = np.arange(60) % 2
+    x = pd.DataFrame({"factor_a": y + rng.normal(0, 0.4, 60), "factor_b": rng.normal(0, 1, 60)})
+    data = TrainingData(x=x, y=pd.Series(y, name="label"))
+    grid_x = pd.DataFrame({"factor_a": np.linspace(-1, 2, 25), "factor_b": np.zeros(25)})
+    cell_ids = np.arange(1, 26)
+
+    serial = bootstrap_assessment(data, grid_x, cell_ids, replicates=8, jobs=1, seed=7)
+    parallel = bootstrap_assessment(data, grid_x, cell_ids, replicates=8, jobs=2, seed=7)
+
+    pd.testing.assert_frame_equal(serial.grid, parallel.grid)
+    pd.testing.assert_frame_equal(serial.weights, parallel.weights)
+
+    grid = serial.grid
+    assert grid["cell_id"].tolist() == cell_ids.tolist()
+    assert (grid["probability_q05"] <= grid["probability_q50"]).all()
+    assert (grid["probability_q50"] <= grid["probability_q95"]).all()
+    assert grid["probability_mean"].iloc[-1] > grid["probability_mean"].iloc[0]
+
+    weights = serial.weights.set_index("factor")
+    assert weights.loc["factor_a", "weight_ci_low"] > 0
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from antevorta.estimators import EstimatorConfig, LogisticTrainer, fit_scaler
+from antevorta.model import TrainingData, train_logistic_regression
+from antevorta.validation import validate_model
+
+
+def _separable(n: int = 200) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    y = np.arange(n) % 2
+    x = np.column_stack([y * 2.0 + rng.normal(0, 0.5, n), rng.normal(0, 1, n)])
+    return x, y
+
+
+def test_warm_start_keeps_previous_fit_intact():
+    x, y = _separable()
+    trainer = LogisticTrainer(EstimatorConfig(warm_start=True))
+
+    first = trainer.fit(x[:100], y[:100])
+    first_coef = first.coef_.copy()
+    second = trainer.fit(x, y)
+
+    assert second is not first
+    np.testing.assert_array_equal(first.coef_, first_coef)
+
+
+def test_sgd_converges_to_lbfgs_coefficients():
+    x, y = _separable(400)
+    x_std = fit_scaler(x).transform(x)
+    reference = LogisticTrainer().fit(x_std, y).coef_[0]
+
+    for seed in (0, 1, 2):
+        config = EstimatorConfig(solver="sgd", seed=seed)
+        in_memory = LogisticTrainer(config).fit(x_std, y)
+        streamed = LogisticTrainer(config).fit_batches(
+            lambda: ((x_std[i : i + 50], y[i : i + 50]) for i in range(0, len(x_std), 50))
+        )
+        np.testing.assert_allclose(in_memory.coef_[0], reference, atol=0.1)
+        np.testing.assert_allclose(streamed.coef_[0], reference, atol=0.1)
+
+    data = TrainingData(x=pd.DataFrame(x, columns=["a", "b"]), y=pd.Series(y, name="label"))
+    fitted = train_logistic_regression(data, config=EstimatorConfig(solver="sgd"))
+    proba = fitted.predict_proba(data.x)
+    assert fitted.scaler is not None
+    assert proba[y == 1].mean() > proba[y == 0].mean()
+
+
+def test_kfold_validation_rejects_warm_start():
+    x, y = _separable()
+    data = TrainingData(x=pd.DataFrame(x, columns=["a", "b"]), y=pd.Series(y, name="label"))
+
+    with pytest.raises(ValueError, match="temporal"):
+        validate_model(data, kfold=3, config=EstimatorConfig(warm_start=True))
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import json
+
 import geopandas as gpd
 from shapely.geometry import Point, Polygon
 
-from antevorta.events import add_events, load_events_geodataframe
+from antevorta.events import _store_geojson_events, add_events, load_events_geodataframe
 from antevorta.project import ProjectState, initialize_project
 
 
@@ -33,3 +35,38 @@ def test_add_events_accepts_geojson(tmp_path, monkeypatch):
     assert stored.name == "events.csv"
     assert len(loaded) == 2
     assert set(loaded.columns) >= {"id", "latitude", "longitude", "timestamp", "geometry"}
+
+
+def test_add_events_streams_geojson_seq_in_batches(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    aoi = gpd.GeoDataFrame(
+        [{"geometry": Polygon([(-0.03, -0.03), (-0.03, 0.03), (0.03, 0.03), (0.03, -0.03)])}],
+        crs="EPSG:4326",
+    )
+    aoi_path = tmp_path / "aoi.geojson"
+    aoi.to_file(aoi_path, driver="GeoJSON")
+
+    lines = [
+        json.dumps(
+            {
+                "type": "Feature",
+                "properties": {"event_time": f"2024-01-{i + 1:02d}T00:00:00Z"},
+                "geometry": {"type": "Point", "coordinates": [0.001 * i, 0.002]},
+            }
+        )
+        for i in range(5)
+    ]
+    events_path = tmp_path / "events.geojsonl"
+    events_path.write_text("\x1e" + "\n\x1e".join(lines) + "\n", encoding="utf-8")
+
+    initialize_project(aoi_path)
+    state = ProjectState.from_cwd()
+    stored = state.data_dir / "events.csv"
+    assert _store_geojson_events(events_path, "event_time", stored, batch_size=2) == 5
+    assert add_events(state, events_path, time_field="event_time") == stored
+    loaded = load_events_geodataframe(stored)
+
+    assert list(loaded["id"]) == [f"event_{i}" for i in range(1, 6)]
+    assert loaded["longitude"].tolist() == [0.001 * i for i in range(5)]
+    assert loaded["timestamp"].is_monotonic_increasing
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+
+from antevorta.export import export_assessment
+
+
+@pytest.mark.parametrize("fmt", ["geojson", "flatgeobuf", "geoparquet"])
+def test_export_formats_support_bbox_reads(tmp_path, fmt):
+    ranked = pd.DataFrame(
+        {
+            "cell_id": [3, 1, 2, 4],
+            "latitude": [0.0, 0.0, 1.0, 1.0],
+            "longitude": [1.0, 0.0, 0.0, 1.0],
+            "probability": [0.9, 0.6, 0.3, 0.1],
+            "likelihood": [1.0, 0.625, 0.25, 0.0],
+        }
+    )
+    weights = pd.DataFrame({"factor": ["roads"], "weight": [-0.5]})
+
+    outputs = export_assessment(ranked, weights, tmp_path, fmt=fmt)
+    path = outputs["likelihood_grid"]
+
+    if fmt == "geoparquet":
+        layer = gpd.read_parquet(path)
+        subset = gpd.read_parquet(path, bbox=(0.5, -0.5, 1.5, 0.5))
+    else:
+        layer = gpd.read_file(path)
+        subset = gpd.read_file(path, bbox=(0.5, -0.5, 1.5, 0.5))
+
+    assert sorted(layer["cell_id"].tolist()) == [1, 2, 3, 4]
+    assert subset["cell_id"].tolist() == [3]
+    assert subset["probability"].tolist() == [0.9]
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import geopandas as gpd
+import numpy as np
+import pytest
+import pandas as pd
+import pyarrow.parquet as pq
+from shapely.geometry import LineString, Polygon
+
+import antevorta.factors as factors_module
+from antevorta.events import add_events, load_events_geodataframe
+from antevorta.factors import add_event_density_factors, add_factor, add_zonal_factor, load_factors
+from antevorta.grid import build_grid, load_grid
+from antevorta.model import (
+    EventHistoryFeatures,
+    build_feature_matrix,
+    build_training_data,
+    train_logistic_regression,
+)
+from antevorta.project import ProjectState, initialize_project
+from antevorta.temporal import select_events
+
+
+def test_event_density_factor_excludes_self(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    aoi = gpd.GeoDataFrame(
+        [{"geometry": Polygon([(-0.03, -0.03), (-0.03, 0.03), (0.03, 0.03), (0.03, -0.03)])}],
+        crs="EPSG:4326",
+    )
+    aoi_path = tmp_path / "aoi.geojson"
+    aoi.to_file(aoi_path, driver="GeoJSON")
+
+    events_df = pd.DataFrame(
+        {
+            "id": ["e1", "e2", "e3", "e4"],
+            "latitude": [0.0, 0.0001, -0.0001, 0.02],
+            "longitude": [0.0, 0.0001, -0.0001, 0.02],
+            "timestamp": [
+                "2024-01-01T00:00:00Z",
+                "2024-01-02T00:00:00Z",
+                "2024-01-03T00:00:00Z",
+                "2024-01-04T00:00:00Z",
+            ],
+        }
+    )
+    events_path = tmp_path / "events.csv"
+    events_df.to_csv(events_path, index=False)
+
+    initialize_project(aoi_path)
+    state = ProjectState.from_cwd()
+    add_events(state, events_path)
+    registered = add_event_density_factors(state, [100.0, 50.0], kernel="count")
+    build_grid(state, resolution_m=500)
+
+    assert [f["name"] for f in registered] == ["events_count_50m", "events_count_100m"]
+
+    events = load_events_geodataframe(state.data_dir / "events.csv")
+    factors = load_factors(state)
+    with_self = build_feature_matrix(events, factors)
+    without_self = build_feature_matrix(events, factors, exclude_self=True)
+
+    np.testing.assert_array_equal(with_self["events_count_100m"].to_numpy(), [3.0, 3.0, 3.0, 1.0])
+    np.testing.assert_array_equal(without_self["events_count_100m"].to_numpy(), [2.0, 2.0, 2.0, 0.0])
+
+    training = build_training_data(events, load_grid(state), factors)
+    assert training.x.iloc[:4]["events_count_100m"].tolist() == [2.0, 2.0, 2.0, 0.0]
+
+    # A time window counts only its own events, and validation windows only past ones.
+    early = select_events(events, until=pd.Timestamp("2024-01-03", tz="UTC"))
+    training = build_training_data(early, load_grid(state), factors)
+    assert training.x.iloc[:2]["events_count_100m"].tolist() == [1.0, 1.0]
+
+    history = EventHistoryFeatures(events, events.iloc[[3]], factors)
+    event_x, background_x = history(np.array([0, 1]))
+    assert event_x["events_count_100m"].tolist() == [1.0, 1.0, 2.0, 0.0]
+    assert background_x["events_count_100m"].tolist() == [0.0]
+
+
+def test_kernel_density_factor_is_scored_in_neighbour_counts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    aoi = gpd.GeoDataFrame(
+        [{"geometry": Polygon([(-0.03, -0.03), (-0.03, 0.03), (0.03, 0.03), (0.03, -0.03)])}],
+        crs="EPSG:4326",
+    )
+    aoi_path = tmp_path / "aoi.geojson"
+    aoi.to_file(aoi_path, driver="GeoJSON")
+
+    rng = np.random.default_rng(0)
+    offsets = rng.normal(scale=0.002, size=(30, 2))
+    events_df = pd.DataFrame(
+        {
+            "id": [f"e{i}" for i in range(30)],
+            "latitude": offsets[:, 0],
+            "longitude": offsets[:, 1],
+            "timestamp": pd.date_range("2024-01-01", periods=30, freq="D", tz="UTC").strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+    )
+    events_path = tmp_path / "events.csv"
+    events_df.to_csv(events_path, index=False)
+
+    initialize_project(aoi_path)
+    state = ProjectState.from_cwd()
+    add_events(state, events_path)
+    add_event_density_factors(state, [300.0], kernel="gaussian")
+    build_grid(state, resolution_m=250)
+
+    # A lone event scores 1 at its own location and nothing once it is excluded.
+    events = load_events_geodataframe(state.data_dir / "events.csv")
+    factors = load_factors(state)
+    lone = events.iloc[[0]]
+    np.testing.assert_allclose(build_feature_matrix(lone, factors, events=lone).to_numpy(), [[1.0]])
+    np.testing.assert_allclose(build_feature_matrix(lone, factors, exclude_self=True, events=lone).to_numpy(), [[0.0]])
+
+    # Raw features under the default lbfgs penalty still get a weight that moves the logit.
+    model = train_logistic_regression(build_training_data(events, load_grid(state), factors))
+    assert model.estimator.coef_[0, 0] > 0.1
+
+
+def test_vector_factor_is_stored_as_geoparquet_and_read_clipped(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    aoi = gpd.GeoDataFrame(
+        [{"geometry": Polygon([(-0.01, -0.01), (-0.01, 0.01), (0.01, 0.01), (0.01, -0.01)])}],
+        crs="EPSG:4326",
+    )
+    aoi_path = tmp_path / "aoi.geojson"
+    aoi.to_file(aoi_path, driver="GeoJSON")
+
+    roads = gpd.GeoDataFrame(
+        [
+            {"geometry": LineString([(-0.02, 0.0), (0.02, 0.0)])},
+            {"geometry": LineString([(1.0, 1.0), (1.1, 1.1)])},
+        ],
+        crs="EPSG:4326",
+    )
+    roads_path = tmp_path / "roads.geojson"
+    roads.to_file(roads_path, driver="GeoJSON")
+
+    initialize_project(aoi_path)
+    state = ProjectState.from_cwd()
+    # One feature per row group, so the bbox read can skip the distant road's group.
+    monkeypatch.setattr(factors_module, "PARQUET_ROW_GROUP_SIZE", 1)
+    factor = add_factor(state, roads_path, "distance", max_distance_m=500.0, simplify_m=1.0)
+
+    stored = gpd.read_parquet(factor["path"])
+    assert factor["name"] == "roads"
+    assert len(stored) == 2
+    assert pq.ParquetFile(factor["path"]).metadata.num_row_groups == 2
+    assert stored.crs.to_string() == factor["crs"]
+    assert len(gpd.read_parquet(factor["path"], bbox=factor["clip_bounds"])) == 1
+
+    build_grid(state, resolution_m=250)
+    distances = build_feature_matrix(load_grid(state), load_factors(state))["roads"]
+    assert distances.min() < 250.0
+    assert distances.max() == 500.0
+
+
+def test_zonal_raster_factor_aggregates_cell_footprints(tmp_path, monkeypatch):
+    rasterio = pytest.importorskip("rasterio")
+    from affine import Affine
+
+    monkeypatch.chdir(tmp_path)
+
+    aoi = gpd.GeoDataFrame(
+        [{"geometry": Polygon([(-0.02, -0.02), (-0.02, 0.02), (0.02, 0.02), (0.02, -0.02)])}],
+        crs="EPSG:4326",
+    )
+    aoi_path = tmp_path / "aoi.geojson"
+    aoi.to_file(aoi_path, driver="GeoJSON")
+
+    # 0.0005 degree pixels (~55 m): 1.0 west of the meridian, 0.0 east of it.
+    size = 200
+    values = np.zeros((size, size), dtype="float32")
+    values[:, : size // 2] = 1.0
+    raster_path = tmp_path / "cover.tif"
+    with rasterio.open(
+        raster_path,
+        "w",
+        driver="GTiff",
+        width=size,
+        height=size,
+        count=1,
+        dtype="float32",
+        crs="EPSG:4326",
+        transform=Affine(0.0005, 0.0, -0.05, 0.0, -0.0005, 0.05),
+        tiled=True,
+        blockxsize=64,
+        blockysize=64,
+    ) as dst:
+        dst.write(values, 1)
+
+    initialize_project(aoi_path)
+    state = ProjectState.from_cwd()
+    build_grid(state, resolution_m=500)
+    mean = add_zonal_factor(state, raster_path, "mean")
+    fraction = add_zonal_factor(state, raster_path, "fraction", threshold=0.5)
+
+    assert [mean["name"], fraction["name"]] == ["cover_mean", "cover_fraction"]
+
+    grid = load_grid(state)
+    features = build_feature_matrix(grid, load_factors(state))
+    longitude, _ = grid.lonlat()
+    west = longitude < -0.003
+    east = longitude > 0.003
+
+    assert features["cover_mean"].between(0.0, 1.0).all()
+    np.testing.assert_allclose(features.loc[west, "cover_mean"], 1.0)
+    np.testing.assert_allclose(features.loc[east, "cover_mean"], 0.0)
+    np.testing.assert_array_equal(features["cover_fraction"], features["cover_mean"])
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import geopandas as gpd
-from shapely.geometry import Polygon
+import numpy as np
+from shapely.geometry import Point, Polygon
 
-from antevorta.grid import build_grid
+from antevorta.grid import build_grid, load_grid
 from antevorta.project import ProjectState, initialize_project
+from antevorta.spatial import LatticeGrid
 
 
 def test_build_grid_generates_cells(tmp_path, monkeypatch):
@@ -21,6 +23,31 @@ def test_build_grid_generates_cells(tmp_path, monkeypatch):
     state = ProjectState.from_cwd()
     grid_path = build_grid(state, resolution_m=500)
 
-    grid = gpd.read_file(grid_path)
+    grid = load_grid(state)
+    assert grid_path.suffix == ".npz"
     assert len(grid) > 0
-    assert {"cell_id", "latitude", "longitude", "geometry"}.issubset(grid.columns)
+    cells = grid.to_geodataframe()
+    assert {"cell_id", "latitude", "longitude", "geometry"}.issubset(cells.columns)
+    assert cells["cell_id"].tolist() == list(range(1, len(grid) + 1))
+
+
+def test_lattice_grid_matches_point_grid():
+    aoi = gpd.GeoDataFrame(
+        [{"geometry": Polygon([(0, 0), (0, 1000), (700, 1300), (1200, 0)])}],
+        crs="EPSG:32618",
+    )
+    grid = LatticeGrid.from_aoi(aoi, 100)
+    polygon = aoi.geometry.iloc[0]
+
+    expected = [
+        (x + 50.0, y + 50.0)
+        for x in np.arange(0, 1200, 100)
+        for y in np.arange(0, 1300, 100)
+        if polygon.contains(Point(x + 50.0, y + 50.0))
+    ]
+    x, y = grid.metric_xy()
+    np.testing.assert_allclose(np.column_stack([x, y]), expected)
+
+    picked = grid.sample(5, seed=3)
+    assert len(set(picked.tolist())) == 5
+    np.testing.assert_array_equal(picked, grid.sample(5, seed=3))
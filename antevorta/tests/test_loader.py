@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+from shapely.geometry import Point, Polygon
+
+import antevorta.factors as factors_module
+from antevorta.events import add_events
+from antevorta.factors import add_event_density_factors, add_factor
+from antevorta.grid import build_grid
+from antevorta.loader import load_assessment_inputs, run_concurrently
+from antevorta.model import build_feature_matrix
+from antevorta.project import ProjectState, initialize_project
+
+
+def test_run_concurrently_keeps_order_and_reports_first_failure():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def task(value, delay):
+        def run():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(delay)
+            with lock:
+                active -= 1
+            return value
+
+        return run
+
+    results = run_concurrently([task(i, 0.05 - i * 0.01) for i in range(5)], max_workers=2)
+    assert results == [0, 1, 2, 3, 4]
+    assert peak <= 2
+
+    def fail(message, delay):
+        def run():
+            time.sleep(delay)
+            raise ValueError(message)
+
+        return run
+
+    with pytest.raises(ValueError, match="first"):
+        run_concurrently([task(0, 0.0), fail("first", 0.05), fail("second", 0.0)], max_workers=3)
+
+
+def test_load_assessment_inputs_prefetches_everything_scoring_reads(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    gpd.GeoDataFrame(
+        [{"geometry": Polygon([(-0.03, -0.03), (-0.03, 0.03), (0.03, 0.03), (0.03, -0.03)])}],
+        crs="EPSG:4326",
+    ).to_file(tmp_path / "aoi.geojson", driver="GeoJSON")
+    pd.DataFrame(
+        {
+            "id": ["e1", "e2", "e3", "e4"],
+            "latitude": [0.001, 0.002, -0.001, -0.002],
+            "longitude": [0.001, -0.001, 0.002, -0.002],
+            "timestamp": ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"],
+        }
+    ).to_csv(tmp_path / "events.csv", index=False)
+
+    initialize_project(tmp_path / "aoi.geojson")
+    state = ProjectState.from_cwd()
+    add_events(state, tmp_path / "events.csv")
+    build_grid(state, resolution_m=1000)
+    # More vector factors than the default cache holds.
+    for i in range(10):
+        path = tmp_path / f"roads_{i}.geojson"
+        gpd.GeoDataFrame([{"geometry": Point(0.001 * i, 0.0)}], crs="EPSG:4326").to_file(path, driver="GeoJSON")
+        add_factor(state, path, "distance", max_distance_m=2000.0 if i % 2 else None)
+    add_event_density_factors(state, [500.0])
+
+    events, grid, factors = load_assessment_inputs(state, until=pd.Timestamp("2024-01-04", tz="UTC"))
+    assert len(events) == 3
+
+    def no_reads(*args, **kwargs):
+        raise AssertionError("scoring read a source the loader should have prefetched")
+
+    monkeypatch.setattr(factors_module, "_read_vector_factor", no_reads)
+    monkeypatch.setattr(factors_module, "load_events_geodataframe", no_reads)
+    monkeypatch.setattr(factors_module, "KDTree", no_reads)
+    build_feature_matrix(grid, factors, events=events)
+    build_feature_matrix(events, factors, exclude_self=True, events=events)
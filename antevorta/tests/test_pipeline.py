@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import geopandas as gpd
+import pandas as pd
+from shapely.geometry import Point, Polygon
+
+from antevorta.events import add_events
+from antevorta.factors import add_factor
+from antevorta.grid import build_grid
+from antevorta.pipeline import Pipeline
+from antevorta.project import ProjectState, initialize_project
+
+
+def test_pipeline_reruns_only_stale_stages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    aoi = gpd.GeoDataFrame(
+        [{"geometry": Polygon([(-0.03, -0.03), (-0.03, 0.03), (0.03, 0.03), (0.03, -0.03)])}],
+        crs="EPSG:4326",
+    )
+    aoi_path = tmp_path / "aoi.geojson"
+    aoi.to_file(aoi_path, driver="GeoJSON")
+
+    events_path = tmp_path / "events.csv"
+    pd.DataFrame(
+        {
+            "id": ["e1", "e2", "e3", "e4"],
+            "latitude": [0.001, 0.002, -0.001, -0.002],
+            "longitude": [0.001, -0.001, 0.002, -0.002],
+            "timestamp": ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"],
+        }
+    ).to_csv(events_path, index=False)
+
+    roads_path = tmp_path / "roads.geojson"
+    gpd.GeoDataFrame([{"geometry": Point(0.0, 0.0)}], crs="EPSG:4326").to_file(roads_path, driver="GeoJSON")
+    water_path = tmp_path / "water.geojson"
+    gpd.GeoDataFrame([{"geometry": Point(0.02, 0.02)}], crs="EPSG:4326").to_file(water_path, driver="GeoJSON")
+
+    initialize_project(aoi_path)
+    state = ProjectState.from_cwd()
+    add_events(state, events_path)
+    add_factor(state, roads_path, "distance")
+    add_factor(state, water_path, "distance")
+    build_grid(state, resolution_m=500)
+
+    first = Pipeline(state, tmp_path).run()
+    assert set(first.values()) == {"ran"}
+    ranked = pd.read_csv(tmp_path / "ranked_grid.csv")
+
+    second = Pipeline(state, tmp_path).run()
+    assert set(second.values()) == {"up-to-date"}
+
+    gpd.GeoDataFrame([{"geometry": Point(0.01, 0.02)}], crs="EPSG:4326").to_file(water_path, driver="GeoJSON")
+    add_factor(state, water_path, "distance")
+    third = Pipeline(state, tmp_path).run()
+    assert third["factor:roads"] == "up-to-date"
+    assert third["factor:water"] == "ran"
+    assert third["model"] == "ran"
+    assert third["exports"] == "ran"
+
+    (tmp_path / "ranked_grid.csv").unlink()
+    fourth = Pipeline(state, tmp_path).run()
+    assert fourth["model"] == "up-to-date"
+    assert fourth["exports"] == "ran"
+    assert len(pd.read_csv(tmp_path / "ranked_grid.csv")) == len(ranked)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from antevorta.temporal import TimeIndex, parse_time_bound, select_events
+
+
+def test_time_index_windows_use_sorted_timestamps():
+    timestamps = pd.Series(
+        [
+            "2024-01-05T00:00:00Z",
+            "2024-01-01T00:00:00Z",
+            "2024-01-09T00:00:00Z",
+            "2024-01-03T00:00:00Z",
+        ]
+    )
+    index = TimeIndex.from_timestamps(timestamps)
+
+    assert index.order.tolist() == [1, 3, 0, 2]
+    window = index.window(parse_time_bound("2024-01-03"), parse_time_bound("2024-01-09"))
+    assert window.tolist() == [3, 0]
+
+    splits = index.rolling_origin(2)
+    assert [(train.tolist(), test.tolist()) for train, test in splits] == [([1, 3], [0, 2])]
+
+    events = pd.DataFrame({"id": ["a", "b", "c", "d"], "timestamp": timestamps})
+    selected = select_events(events, since=parse_time_bound("2024-01-04"))
+    assert selected["id"].tolist() == ["a", "c"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pandas as pd
 
 from antevorta.model import TrainingData
-from antevorta.validation import validate_model
+from antevorta.validation import validate_model, validate_temporal
 
 
 def test_validation_metrics_are_deterministic():
@@ -21,3 +21,15 @@ def test_validation_metrics_are_deterministic():
     assert metrics_1 == metrics_2
     assert 0.0 <= metrics_1["auc_mean"] <= 1.0
     assert metrics_1["auc_std"] >= 0.0
+
+
+def test_temporal_validation_scores_future_windows():
+    event_x = pd.DataFrame({"factor_a": [0.9, 0.8, 0.95, 0.85, 0.7, 0.9]})
+    timestamps = pd.Series(pd.date_range("2024-01-01", periods=6, freq="D", tz="UTC"))
+    background_x = pd.DataFrame({"factor_a": [0.1, 0.2, 0.3, 0.15, 0.25, 0.05, 0.35, 0.4]})
+
+    metrics = validate_temporal(event_x, timestamps, background_x, windows=3, seed=42)
+
+    assert metrics["windows"] == 3.0
+    assert metrics["folds"] == 2.0
+    assert metrics["auc_mean"] == 1.0
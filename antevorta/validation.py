@@ -1,39 +1,72 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+
 import numpy as np
-from sklearn.linear_model import LogisticRegression
+import pandas as pd
 from sklearn.metrics import roc_auc_score
 from sklearn.model_selection import KFold
 
 from antevorta.config import CONFIG
+from antevorta.estimators import EstimatorConfig, LogisticTrainer, fit_scaler
 from antevorta.model import TrainingData
+from antevorta.temporal import TimeIndex
+
+
+# Maps the positions of events before a window to that window's event-history
+# feature columns for every event and background point.
+HistoryFeatures = Callable[[np.ndarray], tuple[pd.DataFrame, pd.DataFrame]]
+
+
+def _feature_arrays(
+    config: EstimatorConfig,
+    *frames: pd.DataFrame,
+) -> list[np.ndarray]:
+    # Standardize once up front so every fold or window reuses the same matrices.
+    arrays = [frame.to_numpy(dtype=float) for frame in frames]
+    if not config.standardize:
+        return arrays
+    scaler = fit_scaler(np.concatenate(arrays, axis=0))
+    return [scaler.transform(array) for array in arrays]
+
+
+def _stack(event_x: np.ndarray, background_x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    x = np.concatenate([event_x, background_x], axis=0)
+    y = np.concatenate([np.ones(len(event_x), dtype=int), np.zeros(len(background_x), dtype=int)])
+    return x, y
 
 
-def validate_model(data: TrainingData, kfold: int, seed: int = CONFIG.seed) -> dict[str, float]:
+def validate_model(
+    data: TrainingData,
+    kfold: int,
+    seed: int = CONFIG.seed,
+    config: EstimatorConfig | None = None,
+) -> dict[str, float]:
     if kfold < 2:
         raise ValueError("kfold must be >= 2")
     if len(data.x) < kfold:
         raise ValueError("kfold cannot exceed number of samples")
 
+    config = config or EstimatorConfig(seed=seed)
+    if config.warm_start:
+        # Every earlier fold trained on rows in the later folds' test sets.
+        raise ValueError("Warm starts are only supported for temporal validation")
+    trainer = LogisticTrainer(config)
+    (x,) = _feature_arrays(config, data.x)
+    y = data.y.to_numpy(dtype=int)
+
     splitter = KFold(n_splits=kfold, shuffle=True, random_state=seed)
     scores: list[float] = []
 
-    for train_idx, test_idx in splitter.split(data.x):
-        x_train = data.x.iloc[train_idx]
-        y_train = data.y.iloc[train_idx]
-        x_test = data.x.iloc[test_idx]
-        y_test = data.y.iloc[test_idx]
+    for train_idx, test_idx in splitter.split(x):
+        y_train = y[train_idx]
+        y_test = y[test_idx]
 
-        if y_train.nunique() < 2 or y_test.nunique() < 2:
+        if np.unique(y_train).size < 2 or np.unique(y_test).size < 2:
             raise ValueError("Each fold must contain both classes; adjust kfold or data")
 
-        model = LogisticRegression(
-            solver="lbfgs",
-            random_state=seed,
-            max_iter=1000,
-        )
-        model.fit(x_train, y_train)
-        preds = model.predict_proba(x_test)[:, 1]
+        model = trainer.fit(x[train_idx], y_train)
+        preds = model.predict_proba(x[test_idx])[:, 1]
         scores.append(float(roc_auc_score(y_test, preds)))
 
     scores_arr = np.array(scores, dtype=float)
@@ -42,3 +75,66 @@ def validate_model(data: TrainingData, kfold: int, seed: int = CONFIG.seed) -> d
         "auc_mean": float(scores_arr.mean()),
         "auc_std": float(scores_arr.std(ddof=0)),
     }
+
+
+def validate_temporal(
+    event_x: pd.DataFrame,
+    event_timestamps: pd.Series,
+    background_x: pd.DataFrame,
+    windows: int,
+    seed: int = CONFIG.seed,
+    config: EstimatorConfig | None = None,
+    history: HistoryFeatures | None = None,
+) -> dict[str, float]:
+    """Rolling-origin validation: train on all events before a window, score the window.
+
+    Event and background features are computed once by the caller and sliced per
+    window. Background rows are split once into fixed train and test halves.
+    Features that depend on past events come from ``history``, called per window
+    with the events before its origin so the window's own events are never counted.
+    """
+    if len(event_x) != len(event_timestamps):
+        raise ValueError("Event features and timestamps must have the same length")
+    if len(background_x) < 2:
+        raise ValueError("Temporal validation requires at least 2 background points")
+
+    splits = TimeIndex.from_timestamps(event_timestamps).rolling_origin(windows)
+    if not splits:
+        raise ValueError("No temporal window has both past and current events; adjust windows or data")
+
+    config = config or EstimatorConfig(seed=seed)
+    trainer = LogisticTrainer(config)
+    if history is None:
+        events, background = _feature_arrays(config, event_x, background_x)
+
+    rng = np.random.default_rng(seed)
+    shuffled = rng.permutation(len(background_x))
+    half = len(shuffled) // 2
+    train_rows = np.sort(shuffled[:half])
+    test_rows = np.sort(shuffled[half:])
+
+    scores: list[float] = []
+    for train_pos, test_pos in splits:
+        if history is not None:
+            past_events, past_background = history(train_pos)
+            events, background = _feature_arrays(
+                config,
+                pd.concat([event_x, past_events], axis=1),
+                pd.concat([background_x, past_background], axis=1),
+            )
+        background_train = background[train_rows]
+        background_test = background[test_rows]
+        x_train, y_train = _stack(events[train_pos], background_train)
+        x_test, y_test = _stack(events[test_pos], background_test)
+
+        model = trainer.fit(x_train, y_train)
+        preds = model.predict_proba(x_test)[:, 1]
+        scores.append(float(roc_auc_score(y_test, preds)))
+
+    scores_arr = np.array(scores, dtype=float)
+    return {
+        "windows": float(windows),
+        "folds": float(len(scores)),
+        "auc_mean": float(scores_arr.mean()),
+        "auc_std": float(scores_arr.std(ddof=0)),
+    }
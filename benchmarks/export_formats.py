@@ -0,0 +1,50 @@
+"""Write-time benchmark for the likelihood grid output formats.
+
+Usage: python benchmarks/export_formats.py [n_cells ...]
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from antevorta.export import LIKELIHOOD_FORMATS, likelihood_layer, write_likelihood_layer
+
+
+def synthetic_ranked_grid(n_cells: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    side = int(np.ceil(np.sqrt(n_cells)))
+    idx = np.arange(n_cells)
+    proba = rng.random(n_cells)
+    ranked = pd.DataFrame(
+        {
+            "cell_id": idx + 1,
+            "latitude": 38.8 + (idx % side) * 0.001,
+            "longitude": -77.1 + (idx // side) * 0.001,
+            "probability": proba,
+            "likelihood": proba,
+        }
+    )
+    return ranked.sort_values("likelihood", ascending=False).reset_index(drop=True)
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    print(f"{'cells':>10} {'format':>11} {'seconds':>9} {'MB':>8}")
+    for n_cells in sizes:
+        layer = likelihood_layer(synthetic_ranked_grid(n_cells))
+        with tempfile.TemporaryDirectory() as tmp:
+            for fmt, name in LIKELIHOOD_FORMATS.items():
+                path = Path(tmp) / name
+                start = time.perf_counter()
+                write_likelihood_layer(layer, path, fmt)
+                elapsed = time.perf_counter() - start
+                print(f"{n_cells:>10} {fmt:>11} {elapsed:>9.2f} {path.stat().st_size / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()